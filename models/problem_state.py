@@ -1,15 +1,34 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
+from types import MappingProxyType
+from typing import BinaryIO, Collection, Iterable, Iterator, Mapping
 
+import numpy as np
 import pandas as pd
 
 from .route import Route
 from .site import Site
+from .site_table import COORD_DTYPE, SiteTable
 from .planning_stage import PlanningStage
 from .workspace_paths import WorkspacePaths
 
+# Probed without importing; pyarrow is imported on first use by the CSV
+# reader and writer, so importing this module stays cheap
+CSV_ENGINE = "pyarrow" if find_spec("pyarrow") is not None else "c"
+
+# Files larger than this are streamed in chunks rather than parsed in one go
+CSV_STREAMING_THRESHOLD_BYTES = 256 * 1024 * 1024
+CSV_CHUNK_ROWS = 100_000
+CSV_WRITE_BUFFER_BYTES = 1 << 20
+
 # This object maintains the entire state of the application. Changes made are propogated to the top-level tab (ie geocode, cluster, solve)
 # csv files are only created to persist the work between sessions.
 
@@ -27,6 +46,28 @@ class ProblemState:
     stage: PlanningStage | None = None
     paths: WorkspacePaths | None = None
 
+    # Bumped whenever `sites` is assigned or invalidate_coords() is called;
+    # the memos below are keyed on (version, len(sites))
+    _sites_version: int = field(default=0, init=False, repr=False, compare=False)
+    # ((version, len(sites)), coords) memo behind coords_array
+    _coords_cache: tuple[tuple[int, int], np.ndarray] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Same keying, memo behind site_table
+    _table_cache: tuple[tuple[int, int], SiteTable] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Same keying, memo behind site_by_id
+    _lookup_cache: tuple[tuple[int, int], dict[str, Site]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value) -> None:
+        if name == 'sites':
+            # A new list invalidates every memo built from the old one
+            object.__setattr__(self, '_sites_version', getattr(self, '_sites_version', 0) + 1)
+        object.__setattr__(self, name, value)
+
     @classmethod
     def from_workspace(
         cls,
@@ -50,8 +91,29 @@ class ProblemState:
 
         paths = WorkspacePaths(state_dir)
 
-        if not state_dir.exists():
-            raise FileNotFoundError(f"State directory does not exist: {state_dir}")
+        # One directory listing instead of a stat() per candidate artifact
+        try:
+            with os.scandir(state_dir) as entries:
+                present = {entry.name: entry for entry in entries if entry.is_file()}
+        except FileNotFoundError:
+            raise FileNotFoundError(f"State directory does not exist: {state_dir}") from None
+
+        # Reuse the last hydrate of this directory if no artifact has changed
+        signature = (
+            _cache_epoch,
+            tuple(
+                (name, present[name].stat().st_mtime_ns, present[name].stat().st_size)
+                for name in _STAGE_ARTIFACTS
+                if name in present
+            ),
+        )
+        cache_key = (state_dir, entity_type)
+        with _workspace_cache_lock:
+            cached = _workspace_cache.get(cache_key)
+            if cached is not None:
+                _workspace_cache.move_to_end(cache_key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]._detached_copy()
 
         # Create empty shell first
         state = cls(
@@ -61,42 +123,215 @@ class ProblemState:
             state_code=state_code,
             paths=paths,
         )
+        state._resume_from_artifacts(present)
+
+        snapshot = state._detached_copy()
+        with _workspace_cache_lock:
+            _workspace_cache[cache_key] = (signature, snapshot)
+            _workspace_cache.move_to_end(cache_key)
+            if len(_workspace_cache) > _WORKSPACE_CACHE_SIZE:
+                _workspace_cache.popitem(last=False)
+        return state
+
+    @classmethod
+    def from_workspace_many(
+        cls,
+        client: str,
+        workspace: str,
+        entity_type: str,
+        state_codes: Iterable[str],
+        base_dir: Path,
+        max_workers: int | None = None,
+    ) -> dict[str, "ProblemState"]:
+        """
+        Hydrate one ProblemState per state code concurrently.
+
+        Each state is independent and pandas releases the GIL while parsing,
+        so the CSV reads overlap across threads. Returns a dict keyed by
+        state code in the order given; the first failure is re-raised.
+        """
+        state_codes = list(state_codes)
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            futures = {
+                state_code: executor.submit(
+                    cls.from_workspace, client, workspace, entity_type, state_code, base_dir
+                )
+                for state_code in state_codes
+            }
+            return {state_code: future.result() for state_code, future in futures.items()}
+
+    def _resume_from_artifacts(self, present: Collection[str]) -> None:
+        """Load sites/clusters/routes from the most advanced artifact in present."""
+        paths = self.paths
+
+        # Resolve each artifact path once
+        solution_csv = paths.solution_csv()
+        clustered_csv = paths.clustered_csv()
+        geocoded_csv = paths.geocoded_csv()
+        addresses_csv = paths.addresses_csv()
 
         # Resume from most advanced artifact
-        if paths.solution_csv().exists():
+        if solution_csv.name in present:
             # Load sites first from the underlying data files
-            if paths.clustered_csv().exists():
-                state.sites, state.clusters = load_clustered_csv(paths.clustered_csv())
-            elif paths.geocoded_csv().exists():
-                state.sites = load_geocoded_csv(paths.geocoded_csv())
-            elif paths.sites_csv().exists():
-                state.sites = load_sites_csv(paths.sites_csv())
+            if clustered_csv.name in present:
+                self.sites, self.clusters = load_clustered_csv(clustered_csv)
+            elif geocoded_csv.name in present:
+                self.sites = load_geocoded_csv(geocoded_csv)
+            elif addresses_csv.name in present:
+                self.sites = load_addresses_csv(addresses_csv)
             
-            # Then load the solution routes on top
-            state.routes = load_solution_csv(paths.solution_csv())
-            state.stage = PlanningStage.SOLVED
-            return state
-
-        if paths.clustered_csv().exists():
-            state.sites, state.clusters = load_clustered_csv(paths.clustered_csv())
-            state.stage = PlanningStage.CLUSTERED
-            return state
-
-        if paths.geocoded_csv().exists():
-            state.sites = load_geocoded_csv(paths.geocoded_csv())
-            state.stage = PlanningStage.GEOCODED
-            return state
-
-        if paths.addresses_csv().exists():
-            state.sites = load_addresses_csv(paths.addresses_csv())
-            state.stage = PlanningStage.ADDRESSES
-            return state
+            # Then load the solution routes on top; solution.csv has no state
+            # column, and every route in this directory belongs to this state
+            self.routes = load_solution_csv(solution_csv)
+            for route in self.routes:
+                route.state_code = self.state_code
+            self.stage = PlanningStage.SOLVED
+            return
+
+        if clustered_csv.name in present:
+            self.sites, self.clusters = load_clustered_csv(clustered_csv)
+            self.stage = PlanningStage.CLUSTERED
+            return
+
+        if geocoded_csv.name in present:
+            self.sites = load_geocoded_csv(geocoded_csv)
+            self.stage = PlanningStage.GEOCODED
+            return
+
+        if addresses_csv.name in present:
+            self.sites = load_addresses_csv(addresses_csv)
+            self.stage = PlanningStage.ADDRESSES
+            return
 
         # Nothing usable exists
         raise FileNotFoundError(
-            f"No usable CSVs found in {state_dir}"
+            f"No usable CSVs found in {paths.root}"
+        )
+
+    @property
+    def coords_array(self) -> np.ndarray:
+        """
+        Read-only (n, 2) float64 array of [lat, lng] for the sites that have
+        coordinates, in site order.
+
+        Memoized; rebuilt when `sites` is reassigned or resized. Call
+        invalidate_coords() after changing coordinates in place.
+        """
+        key = (self._sites_version, len(self.sites))
+        if self._coords_cache is None or self._coords_cache[0] != key:
+            located = [s for s in self.sites if s.lat is not None and s.lng is not None]
+            n = len(located)
+            # One pass writing interleaved lat, lng straight into the row-major buffer
+            coords = np.fromiter(
+                (v for s in located for v in (s.lat, s.lng)), dtype=np.float64, count=2 * n
+            ).reshape(n, 2)
+            coords.flags.writeable = False
+            self._coords_cache = (key, coords)
+        return self._coords_cache[1]
+
+    @property
+    def site_table(self) -> SiteTable:
+        """
+        Memoized column-oriented snapshot of `sites`, shared by the CSV
+        writers and services so they don't each walk the Site objects.
+
+        Rebuilt when `sites` is reassigned or resized. Call invalidate_coords()
+        after changing site fields in place, or update the table's arrays
+        alongside the sites.
+        """
+        key = (self._sites_version, len(self.sites))
+        if self._table_cache is None or self._table_cache[0] != key:
+            self._table_cache = (key, SiteTable.from_sites(self.sites))
+        return self._table_cache[1]
+
+    @property
+    def site_by_id(self) -> dict[str, Site]:
+        """
+        Memoized site ID -> Site lookup over `sites`.
+
+        Rebuilt when `sites` is reassigned or resized. Call invalidate_coords()
+        after changing site IDs in place.
+        """
+        key = (self._sites_version, len(self.sites))
+        if self._lookup_cache is None or self._lookup_cache[0] != key:
+            self._lookup_cache = (key, {s.id: s for s in self.sites})
+        return self._lookup_cache[1]
+
+    def invalidate_coords(self) -> None:
+        """Drop the memoized coords_array, site_table and site_by_id after sites change in place."""
+        self._sites_version += 1
+        self._coords_cache = None
+        self._table_cache = None
+        self._lookup_cache = None
+
+    def _detached_copy(self) -> "ProblemState":
+        """Copy with fresh Site/Route objects, so the copy can be mutated freely."""
+        copies = {id(site): replace(site) for site in self.sites}
+        return replace(
+            self,
+            sites=list(copies.values()),
+            clusters=None if self.clusters is None else {
+                cluster_id: [copies[id(site)] for site in members]
+                for cluster_id, members in self.clusters.items()
+            },
+            routes=None if self.routes is None else [
+                replace(route, sequence=list(route.sequence)) for route in self.routes
+            ],
         )
 
+
+# Artifacts whose presence/mtime determine what from_workspace hydrates
+_STAGE_ARTIFACTS = ('addresses.csv', 'geocoded.csv', 'clustered.csv', 'solution.csv')
+
+# state_dir/entity_type -> (artifact signature, hydrated ProblemState), most recently used last
+_workspace_cache: OrderedDict[tuple[Path, str], tuple[tuple, ProblemState]] = OrderedDict()
+_WORKSPACE_CACHE_SIZE = 8
+_workspace_cache_lock = threading.Lock()
+
+# Bumped on every artifact write so cached hydrates are invalidated even on
+# filesystems with coarse mtime resolution
+_cache_epoch = 0
+
+
+def invalidate_workspace_cache(path: Path) -> None:
+    """Record that an artifact at path is being written.
+
+    Every writer of state-directory files calls this, so from_workspace never
+    serves a hydrate older than the files, even when mtimes don't change.
+    """
+    global _cache_epoch
+    with _workspace_cache_lock:
+        _cache_epoch += 1
+        for key in [key for key in _workspace_cache if key[0] == path.parent]:
+            del _workspace_cache[key]
+
+
+# Loader schemas: (role, candidate normalized column names) in priority order.
+# Columns not named here are skipped by the parser.
+_ADDRESSES_SCHEMA = (
+    ('site_id', ('site_id',)),
+    ('state', ('state',)),
+    ('address1', ('address1',)),
+    ('address2', ('address2',)),
+    ('city', ('city',)),
+)
+_GEOCODED_SCHEMA = (
+    ('id', ('siteid', 'loc')),
+    ('state', ('state', 'st')),
+    ('address', ('address',)),
+    ('lat', ('lat',)),
+    ('lng', ('lng', 'lon')),
+)
+_CLUSTERED_SCHEMA = (
+    ('id', ('siteid', 'site_id', 'loc')),
+    ('state', ('state', 'st')),
+    ('address', ('address', 'displayname')),
+    ('lat', ('lat',)),
+    ('lng', ('lng', 'lon')),
+    ('cluster', ('cluster_id', 'clusterid', 'cluster')),
+)
+
+
 def load_addresses_csv(path: Path) -> list[Site]:
     """Load sites from addresses.csv (pre-geocoding).
     
@@ -104,161 +339,248 @@ def load_addresses_csv(path: Path) -> list[Site]:
     - site_id, address1, address2, city, state, zip
     """
 
-    if not path.exists():
-        raise FileNotFoundError(path)
-
-    df = pd.read_csv(path)
-    columns = [col.lower().strip() for col in df.columns]
-    
-    # Verify required columns exist
-    if 'site_id' not in columns:
-        raise ValueError(f"{path.name} is missing 'site_id' column")
-    
-    if 'state' not in columns:
-        raise ValueError(f"{path.name} is missing 'state' column")
-    
-    # Get column references
-    id_col = df.columns[columns.index('site_id')]
-    state_col = df.columns[columns.index('state')]
-
-    sites: list[Site] = []
-
-    for _, row in df.iterrows():
-        # Get ID and state
-        site_id = str(row[id_col])
-        state_code = str(row[state_col]).strip()
+    # Opening raises FileNotFoundError for a missing file; no separate exists() stat
+    with path.open('rb') as f:
+        cols = _resolve_schema(tuple(_read_header(f).columns), _ADDRESSES_SCHEMA)
         
-        # Build address string from address1, address2, city
-        parts = []
-        for col_name in ['address1', 'address2', 'city']:
-            if col_name in columns:
-                orig_col = df.columns[columns.index(col_name)]
-                val = str(row[orig_col]).strip()
-                if val and val.lower() != 'nan':
-                    parts.append(val)
+        # Verify required columns exist
+        if cols['site_id'] is None:
+            raise ValueError(f"{path.name} is missing 'site_id' column")
         
-        address = ', '.join(parts) if parts else site_id
+        if cols['state'] is None:
+            raise ValueError(f"{path.name} is missing 'state' column")
         
-        sites.append(
-            Site(
-                id=site_id,
-                address=address,
-                state_code=state_code,
-                lat=None,
-                lng=None,
-                display_name=address,
+        sites: list[Site] = []
+        text_cols = list(cols.values())
+        # IDs load verbatim; the state and address parts are stripped
+        strip_cols = [cols[role] for role in ('state', 'address1', 'address2', 'city')]
+        
+        for columns in _iter_resolved_columns(f, text_cols, numeric_cols=[], strip_cols=strip_cols):
+            ids = pd.Series(columns[cols['site_id']], dtype=object)
+            states = columns[cols['state']]
+            
+            # Build address string from address1, address2, city in one str.cat:
+            # each non-blank part is prefixed with ', ' and the leading separator
+            # dropped, which matches ', '.join(non_empty_parts)
+            pieces = []
+            for role in ['address1', 'address2', 'city']:
+                if cols[role] is not None:
+                    part = pd.Series(columns[cols[role]], dtype=object)
+                    pieces.append((', ' + part).where(part != '', ''))
+            
+            if pieces:
+                address = pieces[0].str.cat(pieces[1:]).str[2:]
+                address = address.where(address != '', ids)
+            else:
+                address = ids
+            
+            sites.extend(
+                Site(
+                    id=site_id,
+                    address=addr,
+                    state_code=state_code,
+                    lat=None,
+                    lng=None,
+                    display_name=addr,
+                )
+                for site_id, addr, state_code in zip(
+                    ids.to_numpy(), address.to_numpy(), states
+                )
             )
-        )
-
+        
     return sites
 
 
 def load_geocoded_csv(path: Path) -> list[Site]:
     """Load geocoded sites from geocoded.csv with lat/lng coordinates."""
-    if not path.exists():
-        raise FileNotFoundError(path)
-
-    df = pd.read_csv(path)
-    columns = [col.lower().strip() for col in df.columns]
-    
-    # Find ID column
-    id_col = None
-    for candidate in ['siteid', 'loc']:
-        if candidate in columns:
-            id_col = df.columns[columns.index(candidate)]
-            break
-    if id_col is None:
-        id_col = df.columns[0]
-    
-    # Find state column
-    state_col = None
-    for candidate in ['state', 'st']:
-        if candidate in columns:
-            state_col = df.columns[columns.index(candidate)]
-            break
-    
-    if state_col is None:
-        raise ValueError(f"{path.name} is missing state column")
-    
-    # Find address column
-    address_col = None
-    if 'address' in columns:
-        address_col = df.columns[columns.index('address')]
-    
-    # Find lat/lng columns
-    lat_col = None
-    lng_col = None
-    if 'lat' in columns:
-        lat_col = df.columns[columns.index('lat')]
-    if 'lng' in columns:
-        lng_col = df.columns[columns.index('lng')]
-    elif 'lon' in columns:
-        lng_col = df.columns[columns.index('lon')]
-    
     sites: list[Site] = []
     
-    for _, row in df.iterrows():
-        site_id = str(row[id_col])
-        state_code = str(row[state_col]).strip()
-        
-        # Get address
-        address = str(row[address_col]).strip() if address_col else site_id
-        
-        # Get coordinates
-        lat = None
-        lng = None
-        if lat_col and pd.notna(row[lat_col]):
-            try:
-                lat = float(row[lat_col])
-            except (ValueError, TypeError):
-                pass
-        
-        if lng_col and pd.notna(row[lng_col]):
-            try:
-                lng = float(row[lng_col])
-            except (ValueError, TypeError):
-                pass
-        
-        sites.append(
+    for ids, states, addresses, lats, lngs in _iter_geocoded_columns(path):
+        # tolist() yields Python floats; NaN (missing) never equals itself
+        sites.extend(
             Site(
                 id=site_id,
                 address=address,
                 state_code=state_code,
-                lat=lat,
-                lng=lng,
+                lat=lat if lat == lat else None,
+                lng=lng if lng == lng else None,
                 display_name=address,
             )
+            for site_id, state_code, address, lat, lng in zip(
+                ids, states, addresses, lats.tolist(), lngs.tolist()
+            )
         )
     
     return sites
 
 
-def save_geocoded_csv(path: Path, sites: list[Site]) -> None:
+def load_geocoded_table(path: Path) -> SiteTable:
+    """Load geocoded.csv straight into a SiteTable, without building Site objects.
+
+    Bulk path for numeric consumers (clustering, distance matrices) on large
+    files; coordinates are quantized to the table's float32 layout.
+    """
+    chunks = list(_iter_geocoded_columns(path))
+    if not chunks:
+        return SiteTable.from_sites([])
+    
+    ids, states, addresses, lats, lngs = (np.concatenate(column) for column in zip(*chunks))
+    return SiteTable(
+        ids=ids.astype(object),
+        addresses=addresses.astype(object),
+        states=states.astype(object),
+        display_names=addresses.astype(object),
+        lats=lats.astype(COORD_DTYPE),
+        lngs=lngs.astype(COORD_DTYPE),
+        cluster_ids=np.full(len(ids), -1, dtype=np.int32),
+    )
+
+
+def _iter_geocoded_columns(
+    path: Path,
+) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+    """Yield (ids, states, addresses, lats, lngs) arrays per chunk of geocoded.csv."""
+    # Opening raises FileNotFoundError for a missing file; no separate exists() stat
+    with path.open('rb') as f:
+        header = _read_header(f)
+        cols = _resolve_schema(tuple(header.columns), _GEOCODED_SCHEMA)
+        
+        # Fall back to the first column for IDs
+        id_col = cols['id'] if cols['id'] is not None else header.columns[0]
+        state_col = cols['state']
+        address_col = cols['address']
+        lat_col = cols['lat']
+        lng_col = cols['lng']
+        
+        if state_col is None:
+            raise ValueError(f"{path.name} is missing state column")
+        
+        numeric_cols = [lat_col, lng_col]
+        for columns in _iter_resolved_columns(
+            f,
+            text_cols=[id_col, state_col, address_col],
+            numeric_cols=numeric_cols,
+            strip_cols=[state_col, address_col],
+        ):
+            ids = columns[id_col]
+            addresses = columns[address_col] if address_col else ids
+            yield (ids, columns[state_col], addresses) + tuple(
+                columns[col] if col else np.full(len(ids), np.nan) for col in numeric_cols
+            )
+
+
+@lru_cache(maxsize=32)
+def _resolve_schema(
+    columns: tuple[str, ...],
+    schema: tuple[tuple[str, tuple[str, ...]], ...],
+) -> Mapping[str, str | None]:
+    """Map each schema role to the original name of its first matching column.
+
+    Headers are matched case- and whitespace-insensitively; roles with no
+    matching column map to None. Cached per (header, schema), so reloading
+    files with a known header skips the probing entirely.
+    """
+    positions: dict[str, int] = {}
+    for pos, col in enumerate(columns):
+        positions.setdefault(str(col).lower().strip(), pos)
+    
+    resolved: dict[str, str | None] = {}
+    for role, candidates in schema:
+        pos = next((positions[c] for c in candidates if c in positions), None)
+        resolved[role] = None if pos is None else columns[pos]
+    return MappingProxyType(resolved)
+
+
+def _read_header(f: BinaryIO) -> pd.DataFrame:
+    """Read just the header row of an open CSV and rewind the handle."""
+    header = pd.read_csv(f, nrows=0)
+    f.seek(0)
+    return header
+
+
+def _iter_resolved_columns(
+    f: BinaryIO,
+    text_cols: list[str | None],
+    numeric_cols: list[str | None],
+    strip_cols: Collection[str | None] = (),
+) -> Iterator[dict[str, np.ndarray]]:
+    """Yield the resolved columns of an open CSV as arrays by column name, per chunk.
+
+    The one reader behind every loader, so a site's ID reads the same from
+    any artifact. With pyarrow installed, files up to
+    CSV_STREAMING_THRESHOLD_BYTES are read straight into an Arrow table;
+    otherwise, or for larger files, the C engine streams DataFrame chunks.
+    Both keep text verbatim (e.g. '003' stays '003').
+    """
+    if CSV_ENGINE == 'pyarrow' and os.fstat(f.fileno()).st_size <= CSV_STREAMING_THRESHOLD_BYTES:
+        yield _read_arrow_columns(f, text_cols, numeric_cols, strip_cols)
+        return
+    
+    yield from _frame_columns(
+        _read_resolved_chunks(f, text_cols=text_cols, numeric_cols=numeric_cols),
+        text_cols, numeric_cols, strip_cols,
+    )
+
+
+def _read_resolved_chunks(
+    f: BinaryIO,
+    text_cols: list[str | None],
+    numeric_cols: list[str | None],
+) -> Iterator[pd.DataFrame]:
+    """Yield the resolved columns of an open CSV through the C engine, with text columns typed as str up front.
+
+    Files up to CSV_STREAMING_THRESHOLD_BYTES are parsed in one go; larger
+    files are streamed in CSV_CHUNK_ROWS-row chunks so peak memory stays
+    bounded. (pandas' pyarrow engine is not used: it infers types before
+    applying dtype=str, which turns IDs like '003' into '3'.)
+
+    Numeric columns are left to the parser's float inference and coerced
+    afterwards by _numeric_column, so malformed values still become NaN
+    instead of failing the whole read.
+    """
+    text = {col for col in text_cols if col is not None}
+    usecols = list(text | {col for col in numeric_cols if col is not None})
+    dtype = {col: str for col in text}
+
+    if os.fstat(f.fileno()).st_size <= CSV_STREAMING_THRESHOLD_BYTES:
+        yield pd.read_csv(f, usecols=usecols, dtype=dtype, engine='c')
+        return
+
+    with pd.read_csv(
+        f, usecols=usecols, dtype=dtype, engine='c', chunksize=CSV_CHUNK_ROWS
+    ) as reader:
+        yield from reader
+
+
+def _numeric_column(df: pd.DataFrame, col: str | None) -> np.ndarray:
+    """Return column as a float64 array, with missing/unparseable values as NaN."""
+    if col is None:
+        return np.full(len(df), np.nan)
+    return pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64)
+
+
+def save_geocoded_csv(path: Path, sites: list[Site] | SiteTable) -> None:
     """Save successfully geocoded sites to geocoded.csv with lat/lng coordinates.
     
     Only saves sites that have valid coordinates (lat and lng are not None).
     """
-    # Create DataFrame from sites with valid coordinates only
-    data = []
-    for site in sites:
-        # Only include sites that were successfully geocoded
-        if site.lat is not None and site.lng is not None:
-            data.append({
-                'SiteID': site.id,
-                'Address': site.address,
-                'State': site.state_code,
-                'Lat': site.lat,
-                'Lng': site.lng,
-                'DisplayName': site.display_name or site.address
-            })
-    
-    df = pd.DataFrame(data)
+    table = _as_site_table(sites)
     
-    # Ensure parent directory exists
-    path.parent.mkdir(parents=True, exist_ok=True)
+    # Only include sites that were successfully geocoded
+    geocoded = ~(np.isnan(table.lats) | np.isnan(table.lngs))
     
-    # Write to CSV
-    df.to_csv(path, index=False)
+    # float32 keeps ~7 significant digits (about a metre at US longitudes)
+    # and shortens the written coordinate text
+    columns = {
+        'SiteID': table.ids[geocoded],
+        'Address': table.addresses[geocoded],
+        'State': table.states[geocoded],
+        'Lat': table.lats[geocoded],
+        'Lng': table.lngs[geocoded],
+        'DisplayName': _display_names(table)[geocoded],
+    }
+    
+    write_csv(columns, path)
 
 
 def save_geocoded_errors_csv(path: Path, sites: list[Site]) -> None:
@@ -266,172 +588,284 @@ def save_geocoded_errors_csv(path: Path, sites: list[Site]) -> None:
     
     Only saves sites that failed to geocode (lat and lng are None).
     """
-    # Create DataFrame from sites that failed to geocode
-    data = []
-    for site in sites:
-        # Only include sites that failed to geocode
-        if site.lat is None or site.lng is None:
-            # Parse address parts
-            parts = [p.strip() for p in site.address.split(',')]
-            
-            # Extract city: typically second-to-last part (before state)
-            # Address format: street, additional_info, city, state
-            city = ''
-            if len(parts) >= 3:
-                # If we have at least 3 parts, city is second-to-last (before state)
-                city = parts[-2]
-            elif len(parts) == 2:
-                # If only 2 parts, second part might be city or state
-                city = parts[1]
-            
-            data.append({
-                'site_id': site.id,
-                'address1': parts[0] if parts else site.address,
-                'city': city,
-                'state': site.state_code,
-                'error': 'Failed to geocode address'
-            })
+    # Only include sites that failed to geocode
+    failed = [site for site in sites if site.lat is None or site.lng is None]
     
     # Only write file if there are errors
-    if data:
-        df = pd.DataFrame(data)
-        
-        # Ensure parent directory exists
-        path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Write to CSV
-        df.to_csv(path, index=False)
+    if not failed:
+        return
+    
+    # Split each address once; format is street, additional_info, city, state
+    parts = pd.Series([site.address for site in failed], dtype=object).str.split(',')
+    n_parts = parts.str.len()
+    
+    # City is typically second-to-last (before state) when there are at least
+    # 3 parts; with only 2 parts the second part might be city or state
+    city = parts.str.get(-2).where(
+        n_parts >= 3,
+        parts.str.get(-1).where(n_parts == 2, ''),
+    )
+    
+    df = pd.DataFrame({
+        'site_id': [site.id for site in failed],
+        'address1': parts.str.get(0).str.strip(),
+        'city': city.str.strip(),
+        'state': [site.state_code for site in failed],
+        'error': 'Failed to geocode address',
+    })
+    
+    write_csv(df, path)
 
 
-def save_clustered_csv(path: Path, sites: list[Site]) -> None:
+def save_clustered_csv(path: Path, sites: list[Site] | SiteTable) -> None:
     """Save clustered sites to clustered.csv with cluster assignments.
     
     Saves sites with their cluster_id assignments.
     """
-    # Create DataFrame from sites
-    data = []
-    for site in sites:
-        data.append({
-            'SiteID': site.id,
-            'Address': site.address,
-            'State': site.state_code,
-            'Lat': site.lat,
-            'Lng': site.lng,
-            'DisplayName': site.display_name or site.address,
-            'cluster_id': site.cluster_id if site.cluster_id is not None else -1
-        })
-    
-    df = pd.DataFrame(data)
+    table = _as_site_table(sites)
+    
+    # float32 keeps ~7 significant digits (about a metre at US longitudes)
+    # and shortens the written coordinate text
+    columns = {
+        'SiteID': table.ids,
+        'Address': table.addresses,
+        'State': table.states,
+        'Lat': table.lats,
+        'Lng': table.lngs,
+        'DisplayName': _display_names(table),
+        'cluster_id': table.cluster_ids,
+    }
+    
+    write_csv(columns, path)
+
+
+def _as_site_table(sites: list[Site] | SiteTable) -> SiteTable:
+    return sites if isinstance(sites, SiteTable) else SiteTable.from_sites(sites)
+
+
+def _display_names(table: SiteTable) -> np.ndarray:
+    """Display names, falling back to the address where missing or empty."""
+    names = table.display_names
+    missing = (names == None) | (names == '')  # noqa: E711 (elementwise on object array)
+    return np.where(missing, table.addresses, names)
+
+
+def write_csv(data: pd.DataFrame | Mapping[str, np.ndarray], path: Path) -> None:
+    """Write a DataFrame or dict of columns to path through a single large buffered binary handle.
+
+    With pyarrow installed the rows are formatted column by column in C++ by
+    _write_arrow_csv, which reproduces DataFrame.to_csv's output byte for
+    byte, so saved files don't depend on whether the extra is installed.
+    """
+    invalidate_workspace_cache(path)
     
     # Ensure parent directory exists
     path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Write to CSV
-    df.to_csv(path, index=False)
+    with open(path, 'wb', buffering=CSV_WRITE_BUFFER_BYTES) as f:
+        if CSV_ENGINE == 'pyarrow':
+            _write_arrow_csv(data, f)
+        else:
+            pd.DataFrame(data).to_csv(f, index=False, lineterminator='\n')
+
+
+def _write_arrow_csv(data: pd.DataFrame | Mapping[str, np.ndarray], f: BinaryIO) -> None:
+    """Format columns with Arrow compute kernels, matching DataFrame.to_csv's output.
+
+    pyarrow.csv.write_csv can't be used as is: it quotes every string (and
+    the header) and prints floats without pandas' trailing '.0'. Instead:
+    floats match NumPy's repr text (what to_csv writes), ints are cast by
+    Arrow, strings are quoted only when they contain a comma, quote or
+    newline (the line terminator), and missing values are empty fields.
+    """
+    import pyarrow as pa
+    from pyarrow import compute as pc
+    
+    columns = []
+    for values in data.values() if isinstance(data, Mapping) else (data[col] for col in data.columns):
+        dtype = getattr(values, 'dtype', None)
+        if dtype is not None and dtype.kind == 'f':
+            text = _float_csv_text(np.asarray(values))
+        elif dtype is not None and dtype.kind in 'iu':
+            text = pa.array(np.asarray(values)).cast(pa.string())
+        else:
+            # from_pandas maps NaN/None to null
+            text = pa.array(values, type=pa.string(), from_pandas=True)
+            needs_quotes = pc.match_substring_regex(text, r'[,"\n]')
+            quoted = pc.binary_join_element_wise('"', pc.replace_substring(text, '"', '""'), '"', '')
+            text = pc.if_else(needs_quotes, quoted, text)
+        columns.append(pc.fill_null(text, ''))
+    
+    f.write((','.join(_quote_csv_field(str(name)) for name in data.keys()) + '\n').encode())
+    if not columns or len(columns[0]) == 0:
+        return
+    
+    # One string per row, then all rows joined into a single buffer
+    rows = pc.binary_join_element_wise(*columns, ',').cast(pa.large_string())
+    body = pc.binary_join(
+        pa.LargeListArray.from_arrays(pa.array([0, len(rows)], pa.int64()), rows),
+        pa.scalar('\n', pa.large_string()),
+    )[0]
+    f.write(body.as_buffer())
+    f.write(b'\n')
+
+
+def _float_csv_text(values: np.ndarray):
+    """Arrow string array of NumPy's repr for each float, with NaN as null.
+
+    Arrow's cast prints the same shortest round-trip digits as NumPy but
+    drops the '.0' of whole numbers, so that is appended. Outside
+    1e-4 < |x| < 1e5 NumPy switches to exponent notation at
+    dtype-dependent points; those rare values take NumPy's own text.
+    """
+    import pyarrow as pa
+    from pyarrow import compute as pc
+    
+    text = pc.cast(pa.array(values, from_pandas=True), pa.string())
+    text = pc.if_else(
+        pc.match_substring_regex(text, r'^-?\d+$'), pc.binary_join_element_wise(text, '.0', ''), text
+    )
+    magnitude = np.abs(values)
+    rare = ~np.isnan(values) & (values != 0) & ~((magnitude > 1e-4) & (magnitude < 1e5))
+    if rare.any():
+        patched = text.to_numpy(zero_copy_only=False)
+        patched[rare] = values[rare].astype(str)
+        text = pa.array(patched, type=pa.string())
+    return text
+
+
+def _quote_csv_field(value: str) -> str:
+    """Quote a field the way DataFrame.to_csv does (csv.QUOTE_MINIMAL, newline rows)."""
+    if any(ch in value for ch in ',"\n'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
 
 
 def load_clustered_csv(path: Path) -> tuple[list[Site], dict[int, list[Site]]]:
     """Load clustered sites from clustered.csv"""
-    if not path.exists():
-        raise FileNotFoundError(path)
-    
-    df = pd.read_csv(path)
-    columns = [col.lower().strip() for col in df.columns]
-    
-    # Find required columns
-    id_col = None
-    for candidate in ['siteid', 'site_id', 'loc']:
-        if candidate in columns:
-            id_col = df.columns[columns.index(candidate)]
-            break
-    if id_col is None:
-        id_col = df.columns[0]
-    
-    # Find state column
-    state_col = None
-    for candidate in ['state', 'st']:
-        if candidate in columns:
-            state_col = df.columns[columns.index(candidate)]
-            break
-    
-    # Find address column
-    address_col = None
-    for candidate in ['address', 'displayname']:
-        if candidate in columns:
-            address_col = df.columns[columns.index(candidate)]
-            break
-    
-    # Find lat/lng columns
-    lat_col = None
-    lng_col = None
-    if 'lat' in columns:
-        lat_col = df.columns[columns.index('lat')]
-    if 'lng' in columns:
-        lng_col = df.columns[columns.index('lng')]
-    elif 'lon' in columns:
-        lng_col = df.columns[columns.index('lon')]
-    
-    # Find cluster_id column
-    cluster_col = None
-    for candidate in ['cluster_id', 'clusterid', 'cluster']:
-        if candidate in columns:
-            cluster_col = df.columns[columns.index(candidate)]
-            break
-    
     sites: list[Site] = []
     clusters: dict[int, list[Site]] = {}
     
-    for _, row in df.iterrows():
-        site_id = str(row[id_col])
-        state_code = str(row[state_col]).strip() if state_col else ""
-        address = str(row[address_col]).strip() if address_col else site_id
-        
-        # Get coordinates
-        lat = None
-        lng = None
-        if lat_col and pd.notna(row[lat_col]):
-            try:
-                lat = float(row[lat_col])
-            except (ValueError, TypeError):
-                pass
-        
-        if lng_col and pd.notna(row[lng_col]):
-            try:
-                lng = float(row[lng_col])
-            except (ValueError, TypeError):
-                pass
+    for ids, states, addresses, lats, lngs, cluster_values in _iter_clustered_columns(path):
+        # Negative or unparseable (NaN, which fails >= 0) cluster ids mean "unassigned";
+        # resolve them for the whole column at once
+        assigned = cluster_values >= 0
+        cluster_ids = np.full(len(cluster_values), None, dtype=object)
+        cluster_ids[assigned] = cluster_values[assigned].astype(np.int64).tolist()
         
-        # Get cluster_id
-        cluster_id = None
-        if cluster_col and pd.notna(row[cluster_col]):
-            try:
-                cluster_id = int(row[cluster_col])
-                if cluster_id < 0:
-                    cluster_id = None
-            except (ValueError, TypeError):
-                pass
-        
-        site = Site(
-            id=site_id,
-            address=address,
-            state_code=state_code,
-            lat=lat,
-            lng=lng,
-            display_name=address,
-            cluster_id=cluster_id,
-        )
-        
-        sites.append(site)
-        
-        # Add to clusters dict
-        if cluster_id is not None:
-            if cluster_id not in clusters:
-                clusters[cluster_id] = []
-            clusters[cluster_id].append(site)
+        # tolist() yields Python floats; NaN (missing) never equals itself
+        for site_id, state_code, address, lat, lng, cluster_id in zip(
+            ids, states, addresses, lats.tolist(), lngs.tolist(), cluster_ids
+        ):
+            site = Site(
+                id=site_id,
+                address=address,
+                state_code=state_code,
+                lat=lat if lat == lat else None,
+                lng=lng if lng == lng else None,
+                display_name=address,
+                cluster_id=cluster_id,
+            )
+            
+            sites.append(site)
+            
+            # Add to clusters dict
+            if cluster_id is not None:
+                if cluster_id not in clusters:
+                    clusters[cluster_id] = []
+                clusters[cluster_id].append(site)
     
     return sites, clusters
 
 
+def _iter_clustered_columns(
+    path: Path,
+) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+    """Yield (ids, states, addresses, lats, lngs, cluster_ids) arrays per chunk of clustered.csv."""
+    # Opening raises FileNotFoundError for a missing file; no separate exists() stat
+    with path.open('rb') as f:
+        header = _read_header(f)
+        cols = _resolve_schema(tuple(header.columns), _CLUSTERED_SCHEMA)
+        
+        # Fall back to the first column for IDs
+        id_col = cols['id'] if cols['id'] is not None else header.columns[0]
+        state_col = cols['state']
+        address_col = cols['address']
+        numeric_cols = [cols['lat'], cols['lng'], cols['cluster']]
+        text_cols = [id_col, state_col, address_col]
+        
+        for columns in _iter_resolved_columns(
+            f, text_cols, numeric_cols, strip_cols=[state_col, address_col]
+        ):
+            ids = columns[id_col]
+            states = columns[state_col] if state_col else np.full(len(ids), "", dtype=object)
+            addresses = columns[address_col] if address_col else ids
+            yield (ids, states, addresses) + tuple(
+                columns[col] if col else np.full(len(ids), np.nan) for col in numeric_cols
+            )
+
+
+def _read_arrow_columns(
+    f: BinaryIO,
+    text_cols: list[str | None],
+    numeric_cols: list[str | None],
+    strip_cols: Collection[str | None] = (),
+) -> dict[str, np.ndarray]:
+    """Read the resolved columns of an open CSV with pyarrow, as arrays by column name.
+
+    Text columns come back as object arrays of str with missing cells as '',
+    numeric columns as float64 with missing or unparseable values as NaN
+    (the same conventions _frame_columns produces from a DataFrame).
+    """
+    import pyarrow as pa
+    from pyarrow import compute as pc
+    from pyarrow import csv as pa_csv
+    
+    text = [col for col in dict.fromkeys(text_cols) if col is not None]
+    numeric = [col for col in dict.fromkeys(numeric_cols) if col is not None and col not in text]
+    # Arrow's default null markers ('NA', 'null', ...) mirror pandas' NA values
+    table = pa_csv.read_csv(f, convert_options=pa_csv.ConvertOptions(
+        include_columns=text + numeric,
+        column_types={col: pa.string() for col in text},
+        strings_can_be_null=True,
+    ))
+    
+    columns: dict[str, np.ndarray] = {}
+    for col in text:
+        values = pc.fill_null(table.column(col), '')
+        if col in strip_cols:
+            values = pc.utf8_trim_whitespace(values)
+        columns[col] = values.to_numpy(zero_copy_only=False)
+    for col in numeric:
+        values = table.column(col)
+        if pa.types.is_string(values.type):
+            # A malformed cell made Arrow infer text; coerce like the pandas path
+            columns[col] = pd.to_numeric(values.to_pandas(), errors='coerce').to_numpy(dtype=np.float64)
+        else:
+            columns[col] = values.cast(pa.float64()).to_numpy(zero_copy_only=False)
+    return columns
+
+
+def _frame_columns(
+    frames: Iterable[pd.DataFrame],
+    text_cols: list[str | None],
+    numeric_cols: list[str | None],
+    strip_cols: Collection[str | None] = (),
+) -> Iterator[dict[str, np.ndarray]]:
+    """Convert DataFrame chunks to the by-name arrays _read_arrow_columns returns."""
+    for df in frames:
+        columns: dict[str, np.ndarray] = {}
+        for col in text_cols:
+            if col is not None:
+                # Text columns are parsed as str already; only missing cells need filling
+                values = df[col].fillna('')
+                columns[col] = (values.str.strip() if col in strip_cols else values).to_numpy()
+        for col in numeric_cols:
+            if col is not None:
+                columns[col] = _numeric_column(df, col)
+        yield columns
+
+
 def load_solution_csv(path: Path) -> list[Route]:
     """
     Load routes from solution.csv.
@@ -447,17 +881,17 @@ def load_solution_csv(path: Path) -> list[Route]:
     from datetime import datetime
     from collections import defaultdict
     
-    if not path.exists():
-        return []
-    
     # Group stops by route_id
     routes_data = defaultdict(list)
     
-    with open(path, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            route_id = int(row['route_id'])
-            routes_data[route_id].append(row)
+    try:
+        with open(path, 'r') as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                route_id = int(row['route_id'])
+                routes_data[route_id].append(row)
+    except FileNotFoundError:
+        return []
     
     # Reconstruct Route objects
     routes = []
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Route:
     state_code: str
     cluster_id: int
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .site import Site
+
+COORD_DTYPE = np.float32
+
+
+@dataclass(slots=True)
+class SiteTable:
+    """Column-oriented (structure-of-arrays) snapshot of a list of sites.
+
+    Numeric code such as clustering and distance matrices works on the
+    contiguous lat/lng arrays instead of walking Site objects. Coordinates
+    are quantized to float32 (about 7 significant digits, roughly a
+    metre at US latitudes), missing coordinates are NaN and unassigned
+    clusters are -1.
+    """
+    ids: np.ndarray
+    addresses: np.ndarray
+    states: np.ndarray
+    display_names: np.ndarray
+    lats: np.ndarray
+    lngs: np.ndarray
+    cluster_ids: np.ndarray
+
+    @classmethod
+    def from_sites(cls, sites: list[Site]) -> "SiteTable":
+        """Build a table from Site objects in a single pass per column."""
+        n = len(sites)
+        return cls(
+            ids=np.array([s.id for s in sites], dtype=object),
+            addresses=np.array([s.address for s in sites], dtype=object),
+            states=np.array([s.state_code for s in sites], dtype=object),
+            display_names=np.array([s.display_name for s in sites], dtype=object),
+            lats=np.fromiter(
+                (np.nan if s.lat is None else s.lat for s in sites), dtype=COORD_DTYPE, count=n
+            ),
+            lngs=np.fromiter(
+                (np.nan if s.lng is None else s.lng for s in sites), dtype=COORD_DTYPE, count=n
+            ),
+            cluster_ids=np.fromiter(
+                (-1 if s.cluster_id is None else s.cluster_id for s in sites), dtype=np.int32, count=n
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, i: int) -> Site:
+        """Materialize row i as a Site (a copy, not a live view)."""
+        lat = self.lats[i]
+        lng = self.lngs[i]
+        cluster_id = int(self.cluster_ids[i])
+        return Site(
+            id=self.ids[i],
+            address=self.addresses[i],
+            state_code=self.states[i],
+            lat=None if np.isnan(lat) else float(lat),
+            lng=None if np.isnan(lng) else float(lng),
+            display_name=self.display_names[i],
+            cluster_id=None if cluster_id < 0 else cluster_id,
+        )
+
+    def coordinates(self) -> np.ndarray:
+        """Return an (n, 2) C-contiguous array of [lat, lng] rows."""
+        return np.column_stack((self.lats, self.lngs))
@@ -0,0 +1,79 @@
+"""
+Great-circle distance matrix kernels.
+
+haversine_matrix fills an (n, n) matrix of miles from coordinate arrays in
+radians. Under Numba it is a single fused pass over the upper triangle,
+mirrored into the lower one and split across cores with prange, so it
+allocates nothing beyond the result. When Numba is not installed it is the
+NumPy broadcasting version haversine_matrix_numpy instead.
+"""
+import math
+
+import numpy as np
+
+from services._jit import NUMBA_AVAILABLE, njit, prange
+
+# Earth radius in miles
+EARTH_RADIUS_MILES = 3959.0
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def haversine_matrix(lat, lng):
+    """
+    Pairwise great-circle distances.
+
+    Args:
+        lat: (n,) float64 latitudes in radians
+        lng: (n,) float64 longitudes in radians
+
+    Returns:
+        (n, n) float64 array of distances in miles with a zero diagonal
+    """
+    n = lat.shape[0]
+    matrix = np.empty((n, n), dtype=np.float64)
+    cos_lat = np.cos(lat)
+    for i in prange(n):
+        matrix[i, i] = 0.0
+        for j in range(i + 1, n):
+            s_lat = math.sin((lat[j] - lat[i]) * 0.5)
+            s_lng = math.sin((lng[j] - lng[i]) * 0.5)
+            a = s_lat * s_lat + cos_lat[i] * cos_lat[j] * s_lng * s_lng
+            d = 2.0 * EARTH_RADIUS_MILES * math.asin(math.sqrt(min(a, 1.0)))
+            matrix[i, j] = d
+            matrix[j, i] = d
+    return matrix
+
+
+def haversine_matrix_numpy(lat, lng):
+    """
+    Pairwise great-circle distances by broadcasting the coordinate columns
+    against each other. Same arguments and result as haversine_matrix.
+    """
+    dlat = lat[:, None] - lat[None, :]
+    dlon = lng[:, None] - lng[None, :]
+    cos_lat = np.cos(lat)
+    a = np.sin(dlat / 2)**2 + cos_lat[:, None] * cos_lat[None, :] * np.sin(dlon / 2)**2
+    # Rounding can push a hair above 1 for antipodal points
+    matrix = 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+    np.fill_diagonal(matrix, 0.0)
+    return matrix
+
+
+def haversine_pairwise(lat1, lng1, lat2, lng2):
+    """
+    Element-wise great-circle distances between two sets of points.
+
+    Args:
+        lat1, lng1: Coordinate arrays of the first points, in radians
+        lat2, lng2: Coordinate arrays of the second points, in radians
+
+    Returns:
+        Array of distances in miles (NaN where any coordinate is NaN)
+    """
+    a = np.sin((lat2 - lat1) / 2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2)**2
+    return 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+if not NUMBA_AVAILABLE:
+    # Without the JIT, the vectorized form is far faster than the scalar loops
+    haversine_matrix = haversine_matrix_numpy
@@ -0,0 +1,18 @@
+"""
+Optional Numba JIT support shared by the numeric kernels.
+
+When Numba is not installed, njit is a no-op decorator and prange is the
+builtin range, so decorated functions still run as plain Python.
+"""
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
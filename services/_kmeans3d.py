@@ -0,0 +1,227 @@
+"""
+Dimension-specialized k-means kernels for sites embedded on the unit sphere.
+
+The coordinates handed to clustering are (n, 3) unit vectors, so the distance
+loop is written out for exactly three components. Under Numba this compiles
+to a tight, vectorizable loop without sklearn's per-iteration overhead; when
+Numba is not installed the same functions run as plain Python, which is only
+suitable for small inputs and tests.
+"""
+import numpy as np
+
+from services._jit import NUMBA_AVAILABLE, njit, prange
+
+# Point chunks per parallel update pass; enough to keep every core busy
+_UPDATE_CHUNKS = 64
+
+# fastmath=True minus 'nnan'/'ninf': the kernels compare against np.inf
+# sentinels, which those flags would let LLVM assume never occur
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+@njit(cache=True)
+def kmeans_pp_3d(points, k, draws):
+    """
+    Pick k initial centers with k-means++ seeding.
+
+    Args:
+        points: (n, 3) float64 array
+        k: Number of centers
+        draws: k uniform samples in [0, 1), one per center picked
+
+    Returns:
+        (k, 3) float64 array of centers
+    """
+    n = points.shape[0]
+    centers = np.empty((k, 3), dtype=np.float64)
+    first = min(int(draws[0] * n), n - 1)
+    centers[0, 0] = points[first, 0]
+    centers[0, 1] = points[first, 1]
+    centers[0, 2] = points[first, 2]
+
+    closest = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        dx = points[i, 0] - centers[0, 0]
+        dy = points[i, 1] - centers[0, 1]
+        dz = points[i, 2] - centers[0, 2]
+        closest[i] = dx * dx + dy * dy + dz * dz
+
+    for c in range(1, k):
+        # Sample proportionally to squared distance from the nearest center
+        target = draws[c] * closest.sum()
+        pick = n - 1
+        acc = 0.0
+        for i in range(n):
+            acc += closest[i]
+            if acc > target:
+                pick = i
+                break
+        centers[c, 0] = points[pick, 0]
+        centers[c, 1] = points[pick, 1]
+        centers[c, 2] = points[pick, 2]
+
+        for i in range(n):
+            dx = points[i, 0] - centers[c, 0]
+            dy = points[i, 1] - centers[c, 1]
+            dz = points[i, 2] - centers[c, 2]
+            d = dx * dx + dy * dy + dz * dz
+            if d < closest[i]:
+                closest[i] = d
+
+    return centers
+
+
+@njit(fastmath=_FASTMATH, cache=True)
+def _center_sq_norms(centers, out):
+    """Fill out[j] with ||c_j||^2."""
+    for j in range(centers.shape[0]):
+        out[j] = centers[j, 0] * centers[j, 0] + centers[j, 1] * centers[j, 1] + centers[j, 2] * centers[j, 2]
+
+
+@njit(fastmath=_FASTMATH, cache=True)
+def _nearest_two(points, i, centers, center_sq):
+    """
+    Return (index of nearest center, its distance, second-nearest distance).
+
+    Points are unit vectors, so ||x - c||^2 = 1 + ||c||^2 - 2 x.c; with the
+    center norms precomputed each candidate costs one 3-wide dot product.
+    """
+    x = points[i, 0]
+    y = points[i, 1]
+    z = points[i, 2]
+    best = 0
+    best_sq = np.inf
+    second_sq = np.inf
+    for j in range(centers.shape[0]):
+        sq = center_sq[j] - 2.0 * (x * centers[j, 0] + y * centers[j, 1] + z * centers[j, 2])
+        if sq < best_sq:
+            second_sq = best_sq
+            best_sq = sq
+            best = j
+        elif sq < second_sq:
+            second_sq = sq
+    return best, np.sqrt(max(1.0 + best_sq, 0.0)), np.sqrt(max(1.0 + second_sq, 0.0))
+
+
+@njit(fastmath=_FASTMATH, parallel=True, cache=True)
+def lloyd_3d(points, centers, max_iter, tol):
+    """
+    Run Lloyd iterations on (n, 3) points until centers stop moving.
+
+    Uses Hamerly's bounds to skip distance computations: each point keeps an
+    upper bound on the distance to its assigned center and a lower bound on
+    the distance to every other center. A point whose upper bound is below
+    both its lower bound and half the gap to the nearest other center cannot
+    change cluster, so it is not re-examined.
+
+    Args:
+        points: (n, 3) float64 array of unit vectors
+        centers: (k, 3) float64 initial centers (not modified)
+        max_iter: Maximum number of iterations
+        tol: Stop once the summed squared center shift is at most this
+
+    Returns:
+        (labels, centers) with labels as an (n,) int32 array
+    """
+    n = points.shape[0]
+    k = centers.shape[0]
+    centers = centers.copy()
+    labels = np.zeros(n, dtype=np.int32)
+    upper = np.empty(n, dtype=np.float64)
+    lower = np.empty(n, dtype=np.float64)
+    half_gap = np.empty(k, dtype=np.float64)
+    center_shift = np.empty(k, dtype=np.float64)
+    center_sq = np.empty(k, dtype=np.float64)
+    _center_sq_norms(centers, center_sq)
+    n_chunks = min(n, _UPDATE_CHUNKS)
+    partial_sums = np.empty((n_chunks, k, 3), dtype=np.float64)
+    partial_counts = np.empty((n_chunks, k), dtype=np.int64)
+
+    for i in prange(n):
+        a, u, l = _nearest_two(points, i, centers, center_sq)
+        labels[i] = a
+        upper[i] = u
+        lower[i] = l
+
+    for _ in range(max_iter):
+        # Half the distance from each center to its nearest other center
+        for j in range(k):
+            gap = np.inf
+            for m in range(k):
+                if m != j:
+                    dx = centers[j, 0] - centers[m, 0]
+                    dy = centers[j, 1] - centers[m, 1]
+                    dz = centers[j, 2] - centers[m, 2]
+                    d = np.sqrt(dx * dx + dy * dy + dz * dz)
+                    if d < gap:
+                        gap = d
+            half_gap[j] = 0.5 * gap
+
+        # Assignment step, skipping points the bounds prove are settled
+        for i in prange(n):
+            a = labels[i]
+            bound = max(half_gap[a], lower[i])
+            if upper[i] <= bound:
+                continue
+            dx = points[i, 0] - centers[a, 0]
+            dy = points[i, 1] - centers[a, 1]
+            dz = points[i, 2] - centers[a, 2]
+            upper[i] = np.sqrt(dx * dx + dy * dy + dz * dz)
+            if upper[i] <= bound:
+                continue
+            a, u, l = _nearest_two(points, i, centers, center_sq)
+            labels[i] = a
+            upper[i] = u
+            lower[i] = l
+
+        # Update step; an empty cluster keeps its previous center. Each chunk
+        # of points accumulates into its own partial sums, so the parallel
+        # loop never writes to shared memory, and the partials are reduced after.
+        partial_sums[:] = 0.0
+        partial_counts[:] = 0
+        for c in prange(n_chunks):
+            for i in range(c * n // n_chunks, (c + 1) * n // n_chunks):
+                j = labels[i]
+                partial_sums[c, j, 0] += points[i, 0]
+                partial_sums[c, j, 1] += points[i, 1]
+                partial_sums[c, j, 2] += points[i, 2]
+                partial_counts[c, j] += 1
+        sums = partial_sums.sum(axis=0)
+        counts = partial_counts.sum(axis=0)
+
+        shift = 0.0
+        for j in range(k):
+            center_shift[j] = 0.0
+            if counts[j] > 0:
+                cx = sums[j, 0] / counts[j]
+                cy = sums[j, 1] / counts[j]
+                cz = sums[j, 2] / counts[j]
+                dx = cx - centers[j, 0]
+                dy = cy - centers[j, 1]
+                dz = cz - centers[j, 2]
+                moved = dx * dx + dy * dy + dz * dz
+                shift += moved
+                center_shift[j] = np.sqrt(moved)
+                centers[j, 0] = cx
+                centers[j, 1] = cy
+                centers[j, 2] = cz
+
+        if shift <= tol:
+            break
+        _center_sq_norms(centers, center_sq)
+
+        # Loosen the bounds by how far the centers moved
+        largest = 0
+        for j in range(1, k):
+            if center_shift[j] > center_shift[largest]:
+                largest = j
+        runner_up = 0.0
+        for j in range(k):
+            if j != largest and center_shift[j] > runner_up:
+                runner_up = center_shift[j]
+        for i in prange(n):
+            a = labels[i]
+            upper[i] += center_shift[a]
+            lower[i] -= runner_up if a == largest else center_shift[largest]
+
+    return labels, centers
@@ -0,0 +1,71 @@
+"""
+Exact tour kernel for clusters small enough to enumerate.
+
+held_karp solves the closed travelling-salesman tour from node 0 by the
+Held-Karp bitmask dynamic program: O(n^2 * 2^n) time and O(n * 2^n) memory,
+which for a dozen sites is a few tens of thousands of states. Compiled with
+Numba when it is installed; plain Python otherwise.
+"""
+import numpy as np
+
+from services._jit import njit
+
+# Above this the 2^n tables stop being cheap
+HELD_KARP_MAX_SITES = 12
+
+_UNREACHED = np.int64(2**62)
+
+
+@njit(cache=True)
+def held_karp(dist):
+    """
+    Shortest closed tour starting and ending at node 0.
+
+    Args:
+        dist: (n, n) int64 arc costs, n >= 2
+
+    Returns:
+        (n,) int64 array of nodes in visiting order, starting with 0
+    """
+    n = dist.shape[0]
+    m = n - 1  # nodes other than the depot; bit j stands for node j + 1
+    full = 1 << m
+    cost = np.full((full, m), _UNREACHED, dtype=np.int64)
+    parent = np.full((full, m), -1, dtype=np.int64)
+    for j in range(m):
+        cost[1 << j, j] = dist[0, j + 1]
+
+    for mask in range(1, full):
+        for j in range(m):
+            if not (mask >> j) & 1:
+                continue
+            here = cost[mask, j]
+            if here == _UNREACHED:
+                continue
+            for k in range(m):
+                if (mask >> k) & 1:
+                    continue
+                nxt = mask | (1 << k)
+                candidate = here + dist[j + 1, k + 1]
+                if candidate < cost[nxt, k]:
+                    cost[nxt, k] = candidate
+                    parent[nxt, k] = j
+
+    # Close the tour back to the depot
+    last = 0
+    best = _UNREACHED
+    for j in range(m):
+        candidate = cost[full - 1, j] + dist[j + 1, 0]
+        if candidate < best:
+            best = candidate
+            last = j
+
+    order = np.zeros(n, dtype=np.int64)
+    mask = full - 1
+    j = last
+    for pos in range(n - 1, 0, -1):
+        order[pos] = j + 1
+        previous = parent[mask, j]
+        mask ^= 1 << j
+        j = previous
+    return order
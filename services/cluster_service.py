@@ -1,23 +1,41 @@
 import json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 import numpy as np
 from pathlib import Path
-from sklearn.cluster import KMeans
+from joblib import Parallel, delayed
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from threadpoolctl import threadpool_limits
 from models.problem_state import ProblemState
+from services._kmeans3d import NUMBA_AVAILABLE, kmeans_pp_3d, lloyd_3d
 
 
 class ClusterService:
     """Service for clustering geocoded sites using K-means algorithm."""
     
-    def __init__(self, algorithm: str = "kmeans", seed: int = 42):
+    def __init__(
+        self,
+        algorithm: str = "kmeans",
+        seed: int = 42,
+        n_init: int = 1,
+        mini_batch_threshold: int = 5000,
+    ):
         """
         Initialize the clustering service.
         
         Args:
             algorithm: Clustering algorithm to use (currently only "kmeans" supported)
             seed: Random seed for reproducibility
+            n_init: Number of k-means++ restarts (one is usually enough for 2-D geodata)
+            mini_batch_threshold: Above this many sites, use MiniBatchKMeans
         """
         self.algorithm = algorithm
         self.seed = seed
+        self.n_init = n_init
+        self.mini_batch_threshold = mini_batch_threshold
     
     def cluster_problem(
         self, 
@@ -48,8 +66,9 @@ class ClusterService:
             raise RuntimeError("No sites to cluster")
         
         # Filter out sites without valid coordinates
-        sites_with_coords = [s for s in sites if s.lat is not None and s.lng is not None]
-        sites_without_coords = [s for s in sites if s.lat is None or s.lng is None]
+        sites_with_coords, sites_without_coords = [], []
+        for s in sites:
+            (sites_without_coords if s.lat is None or s.lng is None else sites_with_coords).append(s)
         
         if sites_without_coords:
             log(f"⚠ Warning: {len(sites_without_coords)} site(s) missing coordinates will be skipped")
@@ -61,27 +80,45 @@ class ClusterService:
         
         log(f"Clustering {len(sites_with_coords)} sites using {self.algorithm}")
         
-        # Determine K if auto mode
-        if selection == "auto":
-            k = self._determine_optimal_k(sites_with_coords, log_callback=log)
-            log(f"Auto-determined K={k}")
-        elif k is None:
-            raise ValueError("K must be specified when selection='manual'")
-        
         # Perform K-means clustering on sites with coordinates
-        coordinates = np.array([[site.lat, site.lng] for site in sites_with_coords])
+        # Row i lines up with sites_with_coords[i]; memoized across re-clusterings
+        coordinates = problem.coords_array
+        
+        # Cluster on the unit sphere: Euclidean k-means on 3-D unit vectors
+        # ranks points the same as great-circle distance, unlike raw degrees
+        # where a degree of longitude shrinks with latitude.
+        embedded = self._unit_vectors(coordinates)
+        
+        if selection != "auto" and k is None:
+            raise ValueError("K must be specified when selection='manual'")
         
-        kmeans = KMeans(n_clusters=k, random_state=self.seed, n_init=10)
-        cluster_labels = kmeans.fit_predict(coordinates)
+        # The 3-D, small-K fits gain nothing from a multi-threaded BLAS, and its
+        # pool would compete with sklearn's OpenMP threads; limit it for the fit
+        with threadpool_limits(limits=1, user_api="blas"):
+            # Determine K if auto mode; the sweep's fit for the chosen K is reused
+            if selection == "auto":
+                k, cluster_labels = self._determine_optimal_k(embedded, log_callback=log)
+                log(f"Auto-determined K={k}")
+            else:
+                cluster_labels = self._fit_labels(embedded, k)
         
         # Assign cluster_id to sites with coordinates
-        for site, cluster_id in zip(sites_with_coords, cluster_labels):
-            site.cluster_id = int(cluster_id)
+        # and group them by cluster in the same pass
+        clusters = {i: [] for i in range(k)}
+        for site, cluster_id in zip(sites_with_coords, cluster_labels.tolist()):
+            site.cluster_id = cluster_id
+            clusters[cluster_id].append(site)
         
         # Sites without coordinates get cluster_id = None (or -1 for "unassigned")
         for site in sites_without_coords:
             site.cluster_id = -1  # -1 indicates unassigned/no coordinates
         
+        # Mirror the assignment into the columnar snapshot used for saving
+        table = problem.site_table
+        located = ~(np.isnan(table.lats) | np.isnan(table.lngs))
+        table.cluster_ids[:] = -1
+        table.cluster_ids[located] = cluster_labels
+        
         log(f"Assigned {len(sites_with_coords)} sites to {k} clusters")
         if sites_without_coords:
             log(f"  {len(sites_without_coords)} sites without coordinates marked as unassigned (cluster_id=-1)")
@@ -89,40 +126,155 @@ class ClusterService:
         # Save cluster preferences
         if problem.paths:
             prefs_path = problem.paths.root / "cluster_prefs.json"
-            self._save_cluster_prefs(prefs_path, k, selection)
+            self._save_cluster_prefs(prefs_path, k, selection, self._engine(len(sites_with_coords), k))
             log(f"Saved cluster preferences to {prefs_path}")
             
             # Save clustered results
             from models.problem_state import save_clustered_csv
-            save_clustered_csv(problem.paths.clustered_csv(), problem.sites)
+            save_clustered_csv(problem.paths.clustered_csv(), table)
             log(f"Saved clustered results to {problem.paths.clustered_csv()}")
         
         # Update problem state
         from models.planning_stage import PlanningStage
         problem.stage = PlanningStage.CLUSTERED
-        problem.clusters = {i: [s for s in sites_with_coords if s.cluster_id == i] for i in range(k)}
+        problem.clusters = clusters
+    
+    def _fit_labels(self, embedded: np.ndarray, k: int) -> np.ndarray:
+        """
+        Cluster (n, 3) unit vectors into k groups.
+        
+        Args:
+            embedded: Output of _unit_vectors
+            k: Number of clusters
+            
+        Returns:
+            (n,) array of cluster labels
+        """
+        engine = self._engine(len(embedded), k)
+        
+        if engine == "lloyd_3d":
+            # Compiled fixed-dimension Lloyd kernel
+            draws = np.random.default_rng(self.seed).random(k)
+            centers = kmeans_pp_3d(embedded, k, draws)
+            labels, _ = lloyd_3d(embedded, centers, 300, 1e-12)
+            return labels
+        
+        if engine == "minibatch":
+            # Large inputs: update centroids from random batches instead of full sweeps
+            kmeans = MiniBatchKMeans(
+                n_clusters=k,
+                random_state=self.seed,
+                batch_size=1024,
+                n_init=3,
+                reassignment_ratio=0.01,
+            )
+        else:
+            # Elkan's triangle-inequality pruning suits low-dimensional data
+            kmeans = KMeans(
+                n_clusters=k,
+                random_state=self.seed,
+                n_init=self.n_init,
+                init="k-means++",
+                algorithm="elkan",
+            )
+        return kmeans.fit_predict(embedded)
+    
+    def _engine(self, n: int, k: int) -> str:
+        """
+        Name the k-means implementation _fit_labels uses for n points and k clusters.
+        
+        Returns:
+            "lloyd_3d" (Numba kernel), "minibatch" (MiniBatchKMeans) or
+            "elkan" (KMeans with triangle-inequality pruning)
+        """
+        if NUMBA_AVAILABLE and n > 500 and k < 64:
+            return "lloyd_3d"
+        if n > self.mini_batch_threshold:
+            return "minibatch"
+        return "elkan"
     
-    def _determine_optimal_k(self, sites, log_callback=None) -> int:
+    @staticmethod
+    def _unit_vectors(coordinates: np.ndarray) -> np.ndarray:
+        """
+        Project [lat, lng] rows in degrees onto 3-D unit vectors.
+        
+        Args:
+            coordinates: (n, 2) array of [lat, lng] in degrees
+            
+        Returns:
+            (n, 3) float64 array of [x, y, z] on the unit sphere
+        """
+        lat = np.radians(coordinates[:, 0])
+        lng = np.radians(coordinates[:, 1])
+        cos_lat = np.cos(lat)
+        embedded = np.empty((len(coordinates), 3), dtype=np.float64)
+        embedded[:, 0] = cos_lat * np.cos(lng)
+        embedded[:, 1] = cos_lat * np.sin(lng)
+        embedded[:, 2] = np.sin(lat)
+        return embedded
+    
+    def _determine_optimal_k(self, points: np.ndarray, log_callback=None) -> tuple[int, np.ndarray]:
         """
         Automatically determine optimal number of clusters.
         Uses elbow method with inertia.
         
+        Candidate K values are fitted on threads. The sklearn engines release
+        the GIL, so their fits overlap; the Numba lloyd_3d kernel holds it
+        (Numba's default threading layer does not allow concurrent calls into
+        a parallel kernel) and instead spreads each fit across cores itself.
+        
+        K is taken where the inertia curve bends most sharply (largest
+        normalized second difference). The difference needs a neighbour on
+        each side, so K=2 and K=10 are fitted only as endpoints and the
+        chosen K is between 3 and 9.
+        
         Args:
-            sites: List of sites with coordinates
+            points: (n, 3) unit vectors from _unit_vectors
             log_callback: Optional logging callback
             
         Returns:
-            Optimal K value
+            Tuple of (optimal K, cluster labels fitted for that K)
         """
-        # Simple heuristic: sqrt(n/2) bounded between 2 and 10
-        n = len(sites)
-        k = max(2, min(10, int(np.sqrt(n / 2))))
-        return k
+        n = len(points)
+        candidates = list(range(2, min(10, n - 1) + 1))
+        
+        # Too few points for an elbow: fall back to sqrt(n/2) bounded between 2 and 10
+        if len(candidates) < 3:
+            k = min(max(2, min(10, int(np.sqrt(n / 2)))), n)
+            return k, self._fit_labels(points, k)
+        
+        fits = Parallel(n_jobs=-1, prefer="threads")(
+            delayed(self._fit_labels)(points, kk) for kk in candidates
+        )
+        inertias = np.array([self._inertia(points, labels) for labels in fits])
+        
+        if log_callback:
+            log_callback("Inertia by K: " + ", ".join(
+                f"{kk}={inertia:.4g}" for kk, inertia in zip(candidates, inertias)
+            ))
+        
+        # Second difference relative to the inertia at that K, so a bend late
+        # in the curve isn't drowned out by the large early drops
+        inner = np.maximum(inertias[1:-1], np.finfo(float).tiny)
+        bend = (inertias[:-2] - 2 * inertias[1:-1] + inertias[2:]) / inner
+        best = int(np.argmax(bend)) + 1
+        return candidates[best], fits[best]
+    
+    @staticmethod
+    def _inertia(points: np.ndarray, labels: np.ndarray) -> float:
+        """Sum of squared distances from each point to its cluster mean."""
+        counts = np.bincount(labels)
+        means = np.zeros((len(counts), points.shape[1]))
+        for dim in range(points.shape[1]):
+            means[:, dim] = np.bincount(labels, weights=points[:, dim], minlength=len(counts))
+        means /= np.maximum(counts, 1)[:, None]
+        return float(((points - means[labels]) ** 2).sum())
     
-    def _save_cluster_prefs(self, path: Path, k: int, selection: str) -> None:
-        """Save clustering preferences to JSON file."""
+    def _save_cluster_prefs(self, path: Path, k: int, selection: str, engine: str) -> None:
+        """Save clustering preferences, including the k-means engine that ran, to JSON file."""
         prefs = {
             "algorithm": self.algorithm,
+            "engine": engine,
             "k": k,
             "selection": selection,
             "seed": self.seed
@@ -131,5 +283,8 @@ class ClusterService:
         # Ensure parent directory exists
         path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(path, 'w') as f:
-            json.dump(prefs, f, indent=2)
+        if ORJSON_AVAILABLE:
+            path.write_bytes(orjson.dumps(prefs, option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, 'w') as f:
+                json.dump(prefs, f, indent=2)
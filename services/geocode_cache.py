@@ -1,12 +1,98 @@
 
 import sqlite3
 import os
-from typing import Optional
-from datetime import datetime
+import re
+import threading
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional
+
+
+_SELECT_ONE = '''
+    SELECT lat, lng, display_name 
+    FROM geocode_cache 
+    WHERE address = ? AND state_code = ?
+'''
+
+# The unix-epoch timestamp is filled in by SQLite itself
+_UPSERT = '''
+    INSERT OR REPLACE INTO geocode_cache 
+    (address, state_code, lat, lng, display_name, timestamp)
+    VALUES (?, ?, ?, ?, ?, CAST(strftime('%s', 'now') AS INTEGER))
+'''
+
+_CREATE_TABLE = '''
+    CREATE TABLE {table} (
+        address TEXT NOT NULL,
+        state_code TEXT NOT NULL,
+        lat REAL,
+        lng REAL,
+        display_name TEXT,
+        timestamp INTEGER NOT NULL,
+        PRIMARY KEY (address, state_code)
+    )
+'''
+
+# Conservative for builds still limited to 999 bound parameters
+_PAIRS_PER_QUERY = 400
+
+# Stored in PRAGMA user_version; bump when the on-disk format changes
+SCHEMA_VERSION = 3
+
+# Common USPS suffix/unit abbreviations, expanded so variants share a cache key
+_ABBREVIATIONS = {
+    'st': 'street',
+    'rd': 'road',
+    'ave': 'avenue',
+    'av': 'avenue',
+    'blvd': 'boulevard',
+    'dr': 'drive',
+    'ln': 'lane',
+    'ct': 'court',
+    'pl': 'place',
+    'pkwy': 'parkway',
+    'hwy': 'highway',
+    'cir': 'circle',
+    'ter': 'terrace',
+    'trl': 'trail',
+    'sq': 'square',
+    'ste': 'suite',
+    'apt': 'apartment',
+    'n': 'north',
+    's': 'south',
+    'e': 'east',
+    'w': 'west',
+}
+
+_PUNCTUATION = re.compile(r"[.#']")
+
+
+def _normalize(address: str) -> str:
+    """
+    Canonical cache key for an address.
+    
+    Lowercases, drops periods/#/apostrophes, collapses whitespace and expands
+    common abbreviations, so '123 Main St.' and '123  main street' match.
+    Comma-separated parts are kept apart.
+    """
+    parts = _PUNCTUATION.sub('', address.lower()).split(',')
+    words = (
+        ' '.join(_ABBREVIATIONS.get(word, word) for word in part.split())
+        for part in parts
+    )
+    return ', '.join(part for part in words if part)
+
+
+def _normalize_state(state_code: str) -> str:
+    return state_code.strip().upper()
 
 
 class GeocodeCache:
-    """SQLite-based cache for geocoding results."""
+    """
+    SQLite-based cache for geocoding results.
+    
+    Entries are keyed on the normalized address and upper-cased state code,
+    so spelling variants of the same address share one entry.
+    """
     
     def __init__(self, db_path: str = None):
         """
@@ -22,33 +108,92 @@ class GeocodeCache:
             db_path = os.path.join(cache_dir, 'geocode_cache.db')
         
         self.db_path = db_path
-        self._init_database()
+        
+        # One connection for the lifetime of the cache; sqlite3 keeps the
+        # prepared statements for the fixed queries below cached on it.
+        # Autocommit mode (isolation_level=None) with explicit transactions
+        # around writes, so reads never open an implicit transaction.
+        # Geocoding runs off the UI thread, so access is serialized by a lock.
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            db_path, check_same_thread=False, isolation_level=None, cached_statements=128
+        )
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('PRAGMA temp_store=MEMORY')
+        self._conn.execute('PRAGMA mmap_size=268435456')
+        with self._transaction():
+            self._init_database()
+    
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Run the block in one BEGIN/COMMIT, rolling back on error."""
+        self._conn.execute('BEGIN')
+        try:
+            yield
+        except BaseException:
+            self._conn.execute('ROLLBACK')
+            raise
+        self._conn.execute('COMMIT')
     
     def _init_database(self):
         """Initialize the database schema if it doesn't exist."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
         
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS geocode_cache (
-                address TEXT NOT NULL,
-                state_code TEXT NOT NULL,
-                lat REAL,
-                lng REAL,
-                display_name TEXT,
-                timestamp TEXT NOT NULL,
-                PRIMARY KEY (address, state_code)
-            )
-        ''')
+        version = cursor.execute('PRAGMA user_version').fetchone()[0]
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'geocode_cache'"
+        ).fetchone()
         
-        # Create index for faster lookups
+        if not exists:
+            cursor.execute(_CREATE_TABLE.format(table='geocode_cache'))
+        else:
+            if version < 1:
+                self._migrate_v0_to_v1(cursor)
+            if version < 2:
+                self._migrate_v1_to_v2(cursor)
+            if version < 3:
+                self._migrate_v2_to_v3(cursor)
+        
+        cursor.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+    
+    def _migrate_v0_to_v1(self, cursor):
+        """Re-key entries written before addresses were normalized."""
+        rows = cursor.execute('''
+            SELECT address, state_code, lat, lng, display_name, timestamp
+            FROM geocode_cache
+            ORDER BY timestamp
+        ''').fetchall()
+        if not rows:
+            return
+        cursor.execute('DELETE FROM geocode_cache')
+        # Oldest first, so the newest entry wins when variants collapse
+        cursor.executemany('''
+            INSERT OR REPLACE INTO geocode_cache 
+            (address, state_code, lat, lng, display_name, timestamp)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', [
+            (_normalize(address), _normalize_state(state_code), *rest)
+            for address, state_code, *rest in rows
+        ])
+    
+    def _migrate_v1_to_v2(self, cursor):
+        """Convert ISO-8601 local-time text timestamps to integer unix epochs."""
+        # SQLite cannot change a column's type in place, so rebuild the table
+        cursor.execute(_CREATE_TABLE.format(table='geocode_cache_v2'))
         cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_address_state 
-            ON geocode_cache(address, state_code)
+            INSERT INTO geocode_cache_v2
+            SELECT address, state_code, lat, lng, display_name,
+                   COALESCE(CAST(strftime('%s', timestamp, 'utc') AS INTEGER),
+                            CAST(strftime('%s', 'now') AS INTEGER))
+            FROM geocode_cache
         ''')
-        
-        conn.commit()
-        conn.close()
+        cursor.execute('DROP TABLE geocode_cache')
+        cursor.execute('ALTER TABLE geocode_cache_v2 RENAME TO geocode_cache')
+    
+    def _migrate_v2_to_v3(self, cursor):
+        """Drop the secondary index that duplicated the (address, state_code) primary key."""
+        cursor.execute('DROP INDEX IF EXISTS idx_address_state')
     
     def get(self, address: str, state_code: str) -> Optional[dict]:
         """
@@ -61,17 +206,10 @@ class GeocodeCache:
         Returns:
             Dictionary with 'lat', 'lng', and 'display_name' or None if not cached
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT lat, lng, display_name 
-            FROM geocode_cache 
-            WHERE address = ? AND state_code = ?
-        ''', (address, state_code))
-        
-        result = cursor.fetchone()
-        conn.close()
+        with self._lock:
+            result = self._conn.execute(
+                _SELECT_ONE, (_normalize(address), _normalize_state(state_code))
+            ).fetchone()
         
         if result:
             lat, lng, display_name = result
@@ -85,6 +223,47 @@ class GeocodeCache:
         
         return None
     
+    def get_many(self, pairs: Iterable[tuple[str, str]]) -> dict[tuple[str, str], dict]:
+        """
+        Retrieve cached geocoding results for many addresses at once.
+        
+        Args:
+            pairs: (address, state_code) tuples
+            
+        Returns:
+            Dictionary mapping (address, state_code) to the same dictionaries
+            get() returns; pairs without valid cached coordinates are omitted
+        """
+        # Normalized key -> the caller's spellings that map to it
+        requested = {}
+        for address, state_code in pairs:
+            key = (_normalize(address), _normalize_state(state_code))
+            requested.setdefault(key, set()).add((address, state_code))
+        keys = list(requested)
+        hits = {}
+        
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit (two per pair)
+            for start in range(0, len(keys), _PAIRS_PER_QUERY):
+                batch = keys[start:start + _PAIRS_PER_QUERY]
+                values = ', '.join(['(?, ?)'] * len(batch))
+                params = [value for pair in batch for value in pair]
+                rows = self._conn.execute(f'''
+                    SELECT address, state_code, lat, lng, display_name 
+                    FROM geocode_cache 
+                    WHERE (address, state_code) IN (VALUES {values})
+                      AND lat IS NOT NULL AND lng IS NOT NULL
+                ''', params)
+                for address, state_code, lat, lng, display_name in rows:
+                    for pair in requested[(address, state_code)]:
+                        hits[pair] = {
+                            'lat': lat,
+                            'lng': lng,
+                            'display_name': display_name
+                        }
+        
+        return hits
+    
     def set(self, address: str, state_code: str, lat: Optional[float], 
             lng: Optional[float], display_name: Optional[str] = None):
         """
@@ -97,27 +276,30 @@ class GeocodeCache:
             lng: Longitude (can be None if geocoding failed)
             display_name: Display name from geocoder
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        timestamp = datetime.now().isoformat()
+        self.set_many([(address, state_code, lat, lng, display_name)])
+    
+    def set_many(self, entries: Iterable[tuple]):
+        """
+        Store several geocoding results in a single transaction.
         
-        cursor.execute('''
-            INSERT OR REPLACE INTO geocode_cache 
-            (address, state_code, lat, lng, display_name, timestamp)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (address, state_code, lat, lng, display_name, timestamp))
+        Args:
+            entries: (address, state_code, lat, lng, display_name) tuples
+        """
+        rows = [
+            (_normalize(address), _normalize_state(state_code), *rest)
+            for address, state_code, *rest in entries
+        ]
+        if not rows:
+            return
         
-        conn.commit()
-        conn.close()
+        # executemany inside one transaction: a single commit/fsync for the batch
+        with self._lock, self._transaction():
+            self._conn.executemany(_UPSERT, rows)
     
     def clear(self):
         """Clear all cached entries."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM geocode_cache')
-        conn.commit()
-        conn.close()
+        with self._lock, self._transaction():
+            self._conn.execute('DELETE FROM geocode_cache')
     
     def get_stats(self) -> dict:
         """
@@ -126,19 +308,27 @@ class GeocodeCache:
         Returns:
             Dictionary with cache statistics
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT COUNT(*) FROM geocode_cache')
-        total_entries = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM geocode_cache WHERE lat IS NOT NULL AND lng IS NOT NULL')
-        successful_entries = cursor.fetchone()[0]
-        
-        conn.close()
+        with self._lock:
+            cursor = self._conn.cursor()
+            
+            cursor.execute('SELECT COUNT(*) FROM geocode_cache')
+            total_entries = cursor.fetchone()[0]
+            
+            cursor.execute('SELECT COUNT(*) FROM geocode_cache WHERE lat IS NOT NULL AND lng IS NOT NULL')
+            successful_entries = cursor.fetchone()[0]
         
         return {
             'total_entries': total_entries,
             'successful_entries': successful_entries,
             'failed_entries': total_entries - successful_entries
         }
+    
+    def close(self):
+        """Close the underlying database connection."""
+        conn = getattr(self, '_conn', None)
+        if conn is not None:
+            conn.close()
+            self._conn = None
+    
+    def __del__(self):
+        self.close()
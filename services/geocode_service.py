@@ -37,13 +37,13 @@ class GeocodeService:
         sites_to_geocode = []
         cache_hits = 0
         
-        for site in sites:
-            # Skip if already geocoded
-            if site.lat is not None and site.lng is not None:
-                continue
-            
+        # Look up every not-yet-geocoded site in one batched query
+        pending = [site for site in sites if site.lat is None or site.lng is None]
+        cached = self._cache.get_many((site.address, site.state_code) for site in pending)
+        
+        for site in pending:
             # Check cache
-            cached_result = self._cache.get(site.address, site.state_code)
+            cached_result = cached.get((site.address, site.state_code))
             
             if cached_result:
                 # Cache hit - use cached coordinates
@@ -59,27 +59,46 @@ class GeocodeService:
         if cache_hits > 0:
             log(f"Found {cache_hits} cached result(s)")
         
-        # Geocode remaining sites
+        # Geocode remaining sites, once per distinct address
         if sites_to_geocode:
-            log(f"Geocoding {len(sites_to_geocode)} site(s) via {self.geocoder_name}")
-            geocoded_sites = self._geocoder.geocode(sites_to_geocode, log_callback=log_callback)
+            unique: dict[tuple[str, str], list[Site]] = {}
+            for site in sites_to_geocode:
+                unique.setdefault((site.address, site.state_code), []).append(site)
+            representatives = [group[0] for group in unique.values()]
+            
+            log(
+                f"Geocoding {len(representatives)} unique address(es) for "
+                f"{len(sites_to_geocode)} site(s) via {self.geocoder_name}"
+            )
+            self._geocoder.geocode(representatives, log_callback=log_callback)
+            
+            # Fan each result out to the other sites sharing the address
+            for first, *rest in unique.values():
+                for site in rest:
+                    site.lat = first.lat
+                    site.lng = first.lng
+                    site.display_name = first.display_name
             
-            # Store results in cache
-            for site in geocoded_sites:
-                self._cache.set(
+            # Store results in cache in one transaction, one row per address
+            self._cache.set_many(
+                (
                     site.address,
                     site.state_code,
                     site.lat,
                     site.lng,
                     getattr(site, 'display_name', None)
                 )
+                for site in representatives
+            )
 
         problem.sites = sites
+        # Coordinates were filled in place, so rebuild the clustering matrix
+        problem.invalidate_coords()
         
         # Persist geocoded results to CSV
         if problem.paths:
             # Save successfully geocoded sites
-            save_geocoded_csv(problem.paths.geocoded_csv(), problem.sites)
+            save_geocoded_csv(problem.paths.geocoded_csv(), problem.site_table)
             log(f"Saved geocoded results to {problem.paths.geocoded_csv()}")
             
             # Save failed geocoding attempts to error file
@@ -2,28 +2,88 @@
 from .geocoder_strategy import Geocoder
 from models.site import Site
 import requests
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 
+class _RateLimiter:
+    """Spaces out call start times to at most `rate` per second across threads."""
+    
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+    
+    def wait(self):
+        """Block until the caller's slot comes up."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+# Public OpenStreetMap server; its usage policy allows 1 request/s from a single thread
+PUBLIC_NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
+
+
 class NominatimGeocoder(Geocoder):
     name = "nominatim"
     
-    def __init__(self, email: str = "user@example.com"):
+    def __init__(
+        self,
+        email: str = "user@example.com",
+        rate_limit: float = 1.0,
+        max_workers: int | None = None,
+        base_url: str = PUBLIC_NOMINATIM_URL,
+    ):
         """
         Initialize Nominatim geocoder.
         
         Args:
             email: Contact email for Nominatim usage policy compliance
+            rate_limit: Maximum requests per second. The public server allows 1;
+                raise it only for a self-hosted instance.
+            max_workers: Requests allowed in flight at once, so response
+                latency overlaps with the rate-limit wait. Defaults to 1 for
+                the public server (which allows no more) and 4 otherwise.
+            base_url: Search endpoint; set it to use a self-hosted instance
+        
+        Raises:
+            ValueError: If max_workers > 1 is requested for the public server
         """
+        is_public = base_url == PUBLIC_NOMINATIM_URL
+        if max_workers is None:
+            max_workers = 1 if is_public else 4
+        elif is_public and max_workers > 1:
+            raise ValueError(
+                "The public Nominatim server allows a single thread; "
+                "set base_url to a self-hosted instance to use max_workers > 1"
+            )
+        
         self.email = email
-        self.base_url = "https://nominatim.openstreetmap.org/search"
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.base_url = base_url
+        self.headers = {
             'User-Agent': f'RoutePlanner/1.0 ({self.email})'
-        })
-        # Nominatim requires max 1 request per second
-        self.request_delay = 1.0
+        }
+        # Nominatim requires max 1 request per second; enforced by _RateLimiter
+        self.rate_limit = rate_limit
+        self.max_workers = max_workers
+        # requests.Session is not thread-safe, so keep one keep-alive session per worker
+        self._local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        """Keep-alive session for the calling thread."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.headers)
+            self._local.session = session
+        return session
 
     def geocode(self, sites: list[Site], log_callback=None) -> list[Site]:
         """
@@ -43,39 +103,53 @@ class NominatimGeocoder(Geocoder):
             else:
                 print(msg)
         
-        for i, site in enumerate(sites):
+        pending = []
+        for site in sites:
             # Skip if already geocoded
             if site.lat is not None and site.lng is not None:
                 log(f"Skipping {site.id} (already geocoded)")
-                continue
-            
+            else:
+                pending.append(site)
+        
+        if not pending:
+            return sites
+        
+        # Requests start at most rate_limit per second, but several may be in
+        # flight at once instead of waiting a full delay after each response
+        limiter = _RateLimiter(self.rate_limit)
+        
+        def fetch(query: str) -> Optional[dict]:
+            limiter.wait()
+            return self._geocode_address(query)
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending))) as executor:
             # Build search query with address and state
-            query = f"{site.address}, {site.state_code}, USA"
-            log(f"Geocoding {site.id}: {query}")
+            queries = [f"{site.address}, {site.state_code}, USA" for site in pending]
+            futures = [executor.submit(fetch, query) for query in queries]
             
-            try:
-                result = self._geocode_address(query)
+            # Collect in submission order so the log reads site by site
+            for site, query, future in zip(pending, queries, futures):
+                log(f"Geocoding {site.id}: {query}")
                 
-                if result:
-                    site.lat = result['lat']
-                    site.lng = result['lng']
-                    site.display_name = result.get('display_name', site.address)
-                    log(f"  ✓ Success: ({site.lat}, {site.lng})")
-                else:
-                    # Geocoding failed, keep as None
+                try:
+                    result = future.result()
+                    
+                    if result:
+                        site.lat = result['lat']
+                        site.lng = result['lng']
+                        site.display_name = result.get('display_name', site.address)
+                        log(f"  ✓ Success: ({site.lat}, {site.lng})")
+                    else:
+                        # Geocoding failed, keep as None
+                        site.lat = None
+                        site.lng = None
+                        log(f"  ✗ Not found")
+                        
+                except Exception as e:
+                    # Log error but continue with other sites
+                    log(f"  ✗ Error: {e}")
                     site.lat = None
                     site.lng = None
-                    log(f"  ✗ Not found")
-                    
-            except Exception as e:
-                # Log error but continue with other sites
-                log(f"  ✗ Error: {e}")
-                site.lat = None
-                site.lng = None
-            
-            # Respect rate limit (1 request per second)
-            if i < len(sites) - 1:  # Don't sleep after last request
-                time.sleep(self.request_delay)
         
         return sites
 
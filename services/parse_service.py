@@ -4,11 +4,39 @@ Handles parsing Excel files based on YAML configuration and outputs state-based
 """
 from __future__ import annotations
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cache
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
-import yaml
+
+from models.problem_state import write_csv
+
+# Optional readers are probed without importing them; each is imported on
+# first use so loading this module stays cheap.
+# Rust calamine bindings with an Arrow bridge, preferred when installed
+FASTEXCEL_AVAILABLE = find_spec("fastexcel") is not None
+# Rust-backed Excel reader, used through pandas when installed
+CALAMINE_AVAILABLE = find_spec("python_calamine") is not None
+
+
+@cache
+def _yaml_loader():
+    """libyaml-backed loader when PyYAML was built with it."""
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+    return Loader
+
+
+# Parsed configs keyed by (resolved path, mtime_ns), most recently used last
+_CONFIG_CACHE: OrderedDict[tuple[str, int], dict[str, Any]] = OrderedDict()
+_CONFIG_CACHE_SIZE = 100
 
 
 class ParseService:
@@ -23,11 +51,42 @@ class ParseService:
         """
         self.config_path = config_path
         self.config = self._load_config()
+        
+        # Mapped Excel headers normalized once per instance; used to select
+        # columns while reading, to validate, and to relabel. Empty mappings
+        # (like address2 might be) are skipped.
+        self._normalized_mapping = {
+            field: excel_col.lower().strip()
+            for field, excel_col in ((self.config or {}).get('columns') or {}).items()
+            if excel_col
+        }
+        # Only these columns are parsed, all as text
+        self._wanted_columns = frozenset(self._normalized_mapping.values())
     
     def _load_config(self) -> dict[str, Any]:
-        """Load and parse the YAML configuration file"""
-        with open(self.config_path, 'r') as f:
-            return yaml.safe_load(f)
+        """
+        Load and parse the YAML configuration file
+        
+        Parsed configs are cached per path and modification time, so
+        constructing the service again for an unchanged file skips parsing.
+        The returned dict is shared between instances and treated as read-only.
+        """
+        config_path = Path(self.config_path)
+        key = (str(config_path.resolve()), config_path.stat().st_mtime_ns)
+        
+        config = _CONFIG_CACHE.get(key)
+        if config is not None:
+            _CONFIG_CACHE.move_to_end(key)
+            return config
+        
+        with open(config_path, 'r') as f:
+            import yaml
+            config = yaml.load(f, Loader=_yaml_loader())
+        
+        _CONFIG_CACHE[key] = config
+        if len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+            _CONFIG_CACHE.popitem(last=False)
+        return config
     
     def parse_excel(
         self,
@@ -56,14 +115,6 @@ class ParseService:
         log(f"Loading Excel file: {excel_path}")
         log(f"Sheet: {sheet_name}")
         
-        # Load the Excel file
-        try:
-            df = pd.read_excel(excel_path, sheet_name=sheet_name, engine="openpyxl")
-            log(f"Loaded {len(df)} rows from Excel")
-        except Exception as e:
-            log(f"ERROR: Failed to load Excel file: {e}")
-            raise
-        
         # Get column mappings from config
         column_mappings = self.config.get('columns', {})
         if not column_mappings:
@@ -71,18 +122,40 @@ class ParseService:
             log(error_msg)
             raise ValueError(error_msg)
         
+        mapped = self._normalized_mapping
+        wanted = self._wanted_columns
+        
+        # Load the Excel file
+        try:
+            if FASTEXCEL_AVAILABLE:
+                df = self._read_sheet_fastexcel(excel_path, sheet_name, wanted)
+            elif CALAMINE_AVAILABLE:
+                df = pd.read_excel(
+                    excel_path,
+                    sheet_name=sheet_name,
+                    engine="calamine",
+                    usecols=lambda name: str(name).strip().lower() in wanted,
+                    dtype="string",
+                )
+            else:
+                df = self._read_sheet_fast(excel_path, sheet_name, wanted)
+            log(f"Loaded {len(df)} rows from Excel")
+        except Exception as e:
+            log(f"ERROR: Failed to load Excel file: {e}")
+            raise
+        
         log(f"Column mappings: {column_mappings}")
         
         # Normalize column names (lowercase, strip whitespace)
-        df.columns = df.columns.str.strip().str.lower()
+        df.columns = [c.strip().lower() if isinstance(c, str) else c for c in df.columns]
         
         # Verify all mapped columns exist in the Excel file
-        missing_columns = []
-        for field, excel_col in column_mappings.items():
-            if excel_col:  # Skip empty mappings (like address2 might be empty)
-                excel_col_lower = excel_col.lower().strip()
-                if excel_col_lower not in df.columns:
-                    missing_columns.append(f"{field} -> {excel_col}")
+        present = frozenset(df.columns)
+        missing_columns = [
+            f"{field} -> {column_mappings[field]}"
+            for field, excel_col in mapped.items()
+            if excel_col not in present
+        ]
         
         if missing_columns:
             error_msg = f"ERROR: Missing required columns: {', '.join(missing_columns)}"
@@ -91,13 +164,12 @@ class ParseService:
         
         log("All required columns found")
         
-        # Create a standardized DataFrame with renamed columns
-        df_standardized = pd.DataFrame()
-        
-        for field, excel_col in column_mappings.items():
-            if excel_col:  # Only map non-empty columns
-                excel_col_lower = excel_col.lower().strip()
-                df_standardized[field] = df[excel_col_lower]
+        # Create a standardized DataFrame with renamed columns: one projection
+        # and a relabel instead of inserting columns one at a time. Positional
+        # relabelling (rather than a rename dict) keeps two fields mapped to the
+        # same Excel column working.
+        df_standardized = df.loc[:, list(mapped.values())]
+        df_standardized.columns = list(mapped)
         
         # Get the state column for grouping
         if 'state' not in df_standardized.columns:
@@ -108,32 +180,139 @@ class ParseService:
         state_column = 'state'
         log(f"Using '{state_column}' column for state grouping")
         
-        # Get unique states
-        states = df_standardized[state_column].dropna().unique()
-        log(f"Found {len(states)} unique states: {', '.join(sorted(str(s) for s in states))}")
+        # Normalize the state column once. As a categorical (a few dozen
+        # codes) the partition works on small integer codes instead of
+        # hashing every row's string.
+        df_standardized[state_column] = (
+            df_standardized[state_column].astype("string").str.strip().astype("category")
+        )
         
-        # Create output directories and write CSV files per state
-        state_counts = {}
-        output_base_path.mkdir(parents=True, exist_ok=True)
+        # Partition by sorting once and slicing contiguous runs of each state
+        # code, rather than materializing a groupby object per state. The
+        # stable sort keeps each state's rows in sheet order; missing states
+        # (code -1) are skipped.
+        df_sorted = df_standardized.sort_values(state_column, kind="stable", ignore_index=True)
+        codes = df_sorted[state_column].cat.codes.to_numpy()
+        categories = df_sorted[state_column].cat.categories
+        starts = np.flatnonzero(np.diff(codes, prepend=-2))
+        ends = np.append(starts[1:], len(codes))
         
-        for state in states:
-            state_str = str(state).strip()
+        state_counts = {}
+        jobs = []
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            code = codes[start]
+            if code < 0:
+                continue
+            state_str = categories[code]
             if not state_str:
                 continue
-            
-            # Filter rows for this state
-            state_df = df_standardized[df_standardized[state_column] == state]
-            row_count = len(state_df)
-            state_counts[state_str] = row_count
-            
-            # Create state directory
-            state_dir = output_base_path / state_str
-            state_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Write CSV file with standardized column names
-            csv_path = state_dir / "addresses.csv"
-            state_df.to_csv(csv_path, index=False)
-            log(f"Wrote {row_count} rows to {csv_path}")
+            state_df = df_sorted.iloc[start:end]
+            state_counts[state_str] = len(state_df)
+            jobs.append((state_df, output_base_path / state_str / "addresses.csv"))
+        
+        log(f"Found {len(state_counts)} unique states: {', '.join(sorted(state_counts))}")
+        
+        # Create output directories: the shared parent first, then every state
+        # directory (all direct children, so they never race) in parallel
+        output_base_path.mkdir(parents=True, exist_ok=True)
+        if jobs:
+            with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as executor:
+                list(executor.map(
+                    lambda job: job[1].parent.mkdir(exist_ok=True), jobs
+                ))
+                
+                # Write CSV files with standardized column names; the shared
+                # writer formats in Arrow/pandas C code that releases the GIL,
+                # so states format and flush concurrently
+                futures = {
+                    executor.submit(write_csv, state_df, csv_path): (len(state_df), csv_path)
+                    for state_df, csv_path in jobs
+                }
+                for future in as_completed(futures):
+                    future.result()
+                    row_count, csv_path = futures[future]
+                    log(f"Wrote {row_count} rows to {csv_path}")
         
         log(f"Parse complete! Processed {len(state_counts)} states")
         return state_counts
+    
+    @staticmethod
+    def _read_sheet_fastexcel(excel_path: Path, sheet_name: str, wanted: frozenset[str]) -> pd.DataFrame:
+        """
+        Read the wanted columns of one sheet with fastexcel
+        
+        The sheet is parsed in Rust and handed over as an Arrow table; columns
+        other than the wanted ones are skipped by the reader itself.
+        
+        Args:
+            excel_path: Path to the Excel file
+            sheet_name: Name of the sheet to read
+            wanted: Lowercased, stripped header names to keep
+        
+        Returns:
+            DataFrame of "string" columns with the first row as the header
+        """
+        import fastexcel
+        
+        sheet = fastexcel.read_excel(str(excel_path)).load_sheet_by_name(
+            sheet_name,
+            use_columns=lambda column: column.name.strip().lower() in wanted,
+        )
+        return sheet.to_arrow().to_pandas().apply(_column_text)
+    
+    @staticmethod
+    def _read_sheet_fast(excel_path: Path, sheet_name: str, wanted: frozenset[str]) -> pd.DataFrame:
+        """
+        Read the wanted columns of one sheet with openpyxl's streaming read-only mode
+        
+        Avoids building openpyxl's full cell/style object model; rows are
+        pulled as plain value tuples, projected to the wanted columns and
+        handed to pandas in one go.
+        
+        Args:
+            excel_path: Path to the Excel file
+            sheet_name: Name of the sheet to read
+            wanted: Lowercased, stripped header names to keep
+        
+        Returns:
+            DataFrame of "string" columns with the first row as the header
+        """
+        import openpyxl
+        
+        wb = openpyxl.load_workbook(excel_path, read_only=True, data_only=True)
+        try:
+            rows = wb[sheet_name].iter_rows(values_only=True)
+            header = next(rows, ())
+            keep = [
+                i for i, name in enumerate(header)
+                if name is not None and str(name).strip().lower() in wanted
+            ]
+            columns = [str(header[i]) for i in keep]
+            records = [
+                [_cell_text(row[i]) if i < len(row) else None for i in keep]
+                for row in rows
+                # Skip fully blank rows, as pd.read_excel does
+                if any(value is not None for value in row)
+            ]
+        finally:
+            wb.close()
+        
+        return pd.DataFrame.from_records(records, columns=columns).astype("string")
+
+
+def _column_text(column: pd.Series) -> pd.Series:
+    """Column as "string", with whole-number floats written without '.0' like read_excel."""
+    if pd.api.types.is_float_dtype(column):
+        values = column.dropna()
+        if (values == values.round()).all():
+            column = column.astype("Int64")
+    return column.astype("string")
+
+
+def _cell_text(value: Any) -> str | None:
+    """Cell value as text, with whole-number floats written without '.0' like read_excel."""
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
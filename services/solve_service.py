@@ -3,11 +3,21 @@ Service for solving VRPTW (Vehicle Routing Problem with Time Windows) using Goog
 """
 from __future__ import annotations
 
-import math
+import multiprocessing
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from models.problem_state import ProblemState
+from typing import Iterator
+
+import numpy as np
+
+from models.problem_state import ProblemState, invalidate_workspace_cache
 from models.route import Route
+from services._haversine import haversine_matrix, haversine_pairwise
+from services._tsp import HELD_KARP_MAX_SITES, held_karp
 
 try:
     from ortools.constraint_solver import routing_enums_pb2
@@ -16,16 +26,57 @@ try:
 except ImportError:
     ORTOOLS_AVAILABLE = False
 
+# Arc costs are integers; distances are passed to the solver in hundredths of a mile
+DISTANCE_SCALE = 100
+
+
+class _BufferedLogger:
+    """
+    Collects log lines and forwards them to a log callback in batches.
+    
+    Lines are joined with newlines and sent once every `every` ticks (one
+    tick per cluster queued) or once `interval_seconds` have passed since
+    the last send, whichever comes first. Call flush() to send immediately,
+    e.g. after each solved cluster, and when done.
+    """
+    
+    def __init__(self, log_callback, every: int = 10, interval_seconds: float = 0.5):
+        self.log_callback = log_callback
+        self.every = every
+        self.interval_seconds = interval_seconds
+        self._lines = []
+        self._ticks = 0
+        self._last_flush = time.monotonic()
+    
+    def __call__(self, msg: str):
+        self._lines.append(msg)
+    
+    def tick(self):
+        """Mark one unit of work done, flushing if a batch is due."""
+        self._ticks += 1
+        if self._ticks >= self.every or time.monotonic() - self._last_flush >= self.interval_seconds:
+            self.flush()
+    
+    def flush(self):
+        """Send any buffered lines as one message."""
+        if self._lines:
+            self.log_callback("\n".join(self._lines))
+            self._lines = []
+        self._ticks = 0
+        self._last_flush = time.monotonic()
+
 
 class SolveService:
     """Service for solving VRPTW optimization problems."""
     
-    def __init__(self, time_limit_seconds: int = 30):
+    def __init__(self, time_limit_seconds: int = 30, max_workers: int | None = None):
         """
         Initialize the solve service.
         
         Args:
             time_limit_seconds: Maximum time to spend solving (default: 30 seconds)
+            max_workers: Processes used to solve clusters in parallel
+                (default: one per CPU core)
         """
         if not ORTOOLS_AVAILABLE:
             raise ImportError(
@@ -33,6 +84,7 @@ class SolveService:
                 "Install it with: pip install ortools"
             )
         self.time_limit_seconds = time_limit_seconds
+        self.max_workers = max_workers or os.cpu_count() or 1
     
     def solve_problem(
         self,
@@ -40,7 +92,11 @@ class SolveService:
         per_cluster: bool = True,
         service_time_hours: float = 0.5,
         speed_mph: float = 50.0,
-        log_callback=None
+        log_callback=None,
+        first_solution_strategy: int | None = None,
+        slack_minutes: int = 60,
+        horizon_minutes: int = 480,
+        metaheuristic: int | None = None
     ) -> list[Route]:
         """
         Solve VRPTW for the given problem state using Google OR-Tools.
@@ -51,6 +107,13 @@ class SolveService:
             service_time_hours: Time spent at each site (in hours)
             speed_mph: Average vehicle speed in miles per hour
             log_callback: Optional callback function for logging messages
+            first_solution_strategy: routing_enums_pb2.FirstSolutionStrategy value used
+                to build the initial solution (default: AUTOMATIC)
+            slack_minutes: Waiting time allowed at each stop (default: 60 minutes)
+            horizon_minutes: Length of the working day each vehicle must fit in
+                (default: 480 minutes, 9am to 5pm)
+            metaheuristic: routing_enums_pb2.LocalSearchMetaheuristic value used to
+                improve the initial solution (default: GENERIC_TABU_SEARCH)
             
         Returns:
             List of Route objects representing the solution
@@ -86,6 +149,12 @@ class SolveService:
         
         routes = []
         
+        # Sequences from an earlier solve of this state, used to warm-start the solver
+        previous_routes = defaultdict(list)
+        for route in problem.routes or []:
+            if route.state_code == problem.state_code:
+                previous_routes[route.cluster_id].append(route.sequence)
+        
         if per_cluster:
             # Solve each cluster separately
             if not problem.clusters:
@@ -93,33 +162,62 @@ class SolveService:
             
             log(f"Solving {len(problem.clusters)} clusters separately...")
             
+            # Clusters partition the state's sites, so compute the distances once
+            # and hand each cluster its submatrix
+            state_distances = self._create_distance_matrix(state_sites)
+            site_index = {s.id: i for i, s in enumerate(state_sites)}
+            
+            # Per-cluster lines go out in batches so a large state doesn't
+            # redraw the log widget once per message; each solved cluster's
+            # result is flushed right away so progress shows as it happens
+            progress = _BufferedLogger(log)
+            
+            jobs = []
             for cluster_id, cluster_sites in sorted(problem.clusters.items()):
-                # Filter cluster sites by state
-                cluster_state_sites = [s for s in cluster_sites if s.state_code == problem.state_code]
+                # Filter cluster sites by state with a set lookup against the
+                # already-filtered state sites
+                indices = [site_index[s.id] for s in cluster_sites if s.id in site_index]
                 
-                if not cluster_state_sites:
-                    log(f"Cluster {cluster_id}: No sites in {problem.state_code}, skipping")
+                if not indices:
+                    progress(f"Cluster {cluster_id}: No sites in {problem.state_code}, skipping")
+                    progress.tick()
                     continue
                 
-                log(f"Cluster {cluster_id}: Solving {len(cluster_state_sites)} sites...")
-                
-                # Solve this cluster using OR-Tools (may return multiple routes/vehicles)
-                cluster_routes = self._solve_single_route(
+                cluster_state_sites = [state_sites[i] for i in indices]
+                progress(f"Cluster {cluster_id}: Solving {len(cluster_state_sites)} sites...")
+                progress.tick()
+                jobs.append(dict(
                     state_code=problem.state_code,
                     cluster_id=cluster_id,
                     sites=cluster_state_sites,
                     service_time_hours=service_time_hours,
                     speed_mph=speed_mph,
-                    log_callback=log
-                )
-                
-                if cluster_routes:
-                    routes.extend(cluster_routes)
-                    total_stops = sum(r.stops for r in cluster_routes)
-                    total_hours = sum(r.service_hours for r in cluster_routes)
-                    log(f"Cluster {cluster_id}: Generated {len(cluster_routes)} route(s), {total_stops} stops, {total_hours:.2f} hours")
-                else:
-                    log(f"Cluster {cluster_id}: Failed to find solution")
+                    first_solution_strategy=first_solution_strategy,
+                    slack_minutes=slack_minutes,
+                    horizon_minutes=horizon_minutes,
+                    metaheuristic=metaheuristic,
+                    distance_matrix=state_distances[np.ix_(indices, indices)],
+                    previous_routes=previous_routes.get(cluster_id)
+                ))
+            
+            # Solve the clusters concurrently (each may return multiple routes/vehicles)
+            progress.flush()
+            try:
+                for job, (cluster_routes, messages) in zip(jobs, self._solve_clusters(jobs)):
+                    cluster_id = job["cluster_id"]
+                    for msg in messages:
+                        progress(msg)
+                    
+                    if cluster_routes:
+                        routes.extend(cluster_routes)
+                        total_stops = sum(r.stops for r in cluster_routes)
+                        total_hours = sum(r.service_hours for r in cluster_routes)
+                        progress(f"Cluster {cluster_id}: Generated {len(cluster_routes)} route(s), {total_stops} stops, {total_hours:.2f} hours")
+                    else:
+                        progress(f"Cluster {cluster_id}: Failed to find solution")
+                    progress.flush()
+            finally:
+                progress.flush()
         else:
             # Solve whole state as one problem
             log(f"Solving whole state ({len(state_sites)} sites) as single problem...")
@@ -130,7 +228,12 @@ class SolveService:
                 sites=state_sites,
                 service_time_hours=service_time_hours,
                 speed_mph=speed_mph,
-                log_callback=log
+                log_callback=log,
+                first_solution_strategy=first_solution_strategy,
+                slack_minutes=slack_minutes,
+                horizon_minutes=horizon_minutes,
+                metaheuristic=metaheuristic,
+                previous_routes=previous_routes.get(0)
             )
             
             if state_routes:
@@ -152,6 +255,35 @@ class SolveService:
         
         return routes
     
+    def _solve_clusters(self, jobs: list[dict]) -> Iterator[tuple[list[Route], list[str]]]:
+        """
+        Solve independent clusters, in parallel processes when there is more than one.
+        
+        Each cluster is its own OR-Tools model and the solver spends its time
+        in C++, so separate processes scale with the number of cores. OR-Tools
+        objects cannot be pickled; each worker builds its model from the plain
+        job arguments and sends back its routes plus the log lines it produced.
+        
+        Args:
+            jobs: Keyword arguments for _solve_single_route, one dict per cluster
+            
+        Yields:
+            (routes, log messages) for each job, in the same order as jobs,
+            as soon as that job and every job before it are solved
+        """
+        workers = min(self.max_workers, len(jobs))
+        if workers <= 1:
+            for job in jobs:
+                yield _solve_cluster(self.time_limit_seconds, job)
+            return
+        
+        # Spawn rather than fork: forking a process that hosts the Qt event loop is unsafe
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            yield from executor.map(_solve_cluster, [self.time_limit_seconds] * len(jobs), jobs)
+    
     def _solve_single_route(
         self,
         state_code: str,
@@ -159,7 +291,13 @@ class SolveService:
         sites: list,
         service_time_hours: float,
         speed_mph: float,
-        log_callback=None
+        log_callback=None,
+        first_solution_strategy: int | None = None,
+        slack_minutes: int = 60,
+        horizon_minutes: int = 480,
+        metaheuristic: int | None = None,
+        distance_matrix: np.ndarray | None = None,
+        previous_routes: list[list[str]] | None = None
     ) -> Route | None:
         """
         Solve a single route using Google OR-Tools TSP solver.
@@ -171,6 +309,17 @@ class SolveService:
             service_time_hours: Service time per site in hours
             speed_mph: Average vehicle speed in MPH
             log_callback: Optional logging callback
+            first_solution_strategy: routing_enums_pb2.FirstSolutionStrategy value
+                (default: AUTOMATIC, letting OR-Tools choose)
+            slack_minutes: Waiting time allowed at each stop
+            horizon_minutes: Length of the working day; every arrival and the
+                return to the depot must fall within it
+            metaheuristic: routing_enums_pb2.LocalSearchMetaheuristic value
+                (default: GENERIC_TABU_SEARCH)
+            distance_matrix: Precomputed (n, n) distances in miles for sites,
+                computed here when not given
+            previous_routes: Site ID sequences from an earlier solve; used as the
+                initial solution when they visit exactly these sites
             
         Returns:
             Route object with optimized solution, or None if no solution found
@@ -194,19 +343,51 @@ class SolveService:
             )]
         
         # Create distance matrix
-        distance_matrix = self._create_distance_matrix(sites)
+        if distance_matrix is None:
+            distance_matrix = self._create_distance_matrix(sites)
         
         # Calculate number of vehicles needed based on time constraints
-        # Estimate: 480 min window / (service_time + avg_travel_time per site)
+        # Estimate: working day / (service_time + avg_travel_time per site)
         service_time_minutes = int(service_time_hours * 60)
         # Rough estimate: assume 15 min average travel between sites
         time_per_site = service_time_minutes + 15
-        max_sites_per_vehicle = max(1, int(420 / time_per_site))  # Use 420 min (7 hours) to be safe
+        # Plan against an hour less than the horizon to be safe
+        max_sites_per_vehicle = max(1, int((horizon_minutes - 60) / time_per_site))
         num_vehicles = max(1, (len(sites) + max_sites_per_vehicle - 1) // max_sites_per_vehicle)
         
         if log_callback:
             log_callback(f"  Estimated {num_vehicles} vehicle(s) needed for {len(sites)} sites")
         
+        # Precompute the integer arc costs once as contiguous int64 matrices;
+        # they are registered with the solver directly, so OR-Tools reads every
+        # arc from its own copy in C++ instead of calling back into Python.
+        # Travel time is distance / speed (in minutes) plus the service time
+        # spent at the departure node before leaving it. Both are rounded to
+        # the nearest unit rather than truncated.
+        distance_int = np.rint(distance_matrix * DISTANCE_SCALE).astype(np.int64)
+        time_int = np.rint(distance_matrix / speed_mph * 60 + service_time_minutes).astype(np.int64)
+        
+        # A cluster one vehicle can cover is small enough to solve exactly,
+        # which is far quicker than a time-limited OR-Tools search. Fall back to
+        # OR-Tools if the shortest tour doesn't fit in the working day.
+        if num_vehicles == 1 and len(sites) <= HELD_KARP_MAX_SITES:
+            order = held_karp(distance_int)
+            tour_minutes = int(time_int[order, np.roll(order, -1)].sum())
+            if tour_minutes <= horizon_minutes:
+                # Total time is the arrival at the last stop, as the solver reports it
+                arrival_minutes = int(time_int[order[:-1], order[1:]].sum())
+                return [Route(
+                    state_code=state_code,
+                    cluster_id=cluster_id,
+                    vehicle_id=1,
+                    stops=len(sites),
+                    sequence=[sites[node].id for node in order],
+                    mode="exact",
+                    speed_mph=speed_mph,
+                    service_hours=arrival_minutes / 60.0,
+                    solved_at=datetime.now()
+                )]
+        
         # Create routing index manager with multiple vehicles
         # All vehicles start and end at the depot (first site)
         manager = pywrapcp.RoutingIndexManager(
@@ -215,69 +396,66 @@ class SolveService:
             0   # Depot index (start at first site)
         )
         
-        # Create routing model
+        # Create routing model. Both transits are registered as matrices, which
+        # OR-Tools reads directly, so the callback cache is left off: it would
+        # only hold a second n^2 copy of each matrix.
         routing = pywrapcp.RoutingModel(manager)
         
-        # Create distance callback
-        def distance_callback(from_index, to_index):
-            """Returns the distance between the two nodes."""
-            from_node = manager.IndexToNode(from_index)
-            to_node = manager.IndexToNode(to_index)
-            return int(distance_matrix[from_node][to_node])
-        
-        transit_callback_index = routing.RegisterTransitCallback(distance_callback)
+        transit_callback_index = routing.RegisterTransitMatrix(distance_int.tolist())
         
         # Define cost of each arc
         routing.SetArcCostEvaluatorOfAllVehicles(transit_callback_index)
         
-        # Add time dimension with time windows
-        # Convert service time from hours to minutes
-        service_time_minutes = int(service_time_hours * 60)
-        
-        # Create time callback that includes both travel time AND service time
-        def time_callback(from_index, to_index):
-            """Returns the time between two nodes including travel and service time."""
-            from_node = manager.IndexToNode(from_index)
-            to_node = manager.IndexToNode(to_index)
-            # Calculate travel time: distance / speed (convert to minutes)
-            travel_time = (distance_matrix[from_node][to_node] / speed_mph) * 60
-            # Add service time at the departure node (from_node)
-            # This ensures we spend service_time at each location before leaving
-            return int(travel_time + service_time_minutes)
-        
-        time_callback_index = routing.RegisterTransitCallback(time_callback)
+        # Time matrix includes both travel time AND service time
+        time_callback_index = routing.RegisterTransitMatrix(time_int.tolist())
         
         # Add time dimension
-        # Time windows: 9am (0 min) to 5pm (480 min = 8 hours)
+        # Time windows: 9am (0 min) to the end of the horizon (480 min = 5pm by default)
         time_dimension_name = 'Time'
         routing.AddDimension(
             time_callback_index,
-            60,  # Allow waiting time (slack) of up to 60 minutes
-            480,  # Maximum time per vehicle (8 hours: 9am to 5pm)
+            slack_minutes,  # Allowed waiting time (slack) at each stop
+            horizon_minutes,  # Maximum time per vehicle
             False,  # Don't force start cumul to zero
             time_dimension_name
         )
         time_dimension = routing.GetDimensionOrDie(time_dimension_name)
         
         # Add time window constraints for each location
-        # All sites must be visited (arrival time) between 9am (0) and 5pm (480 minutes)
+        # All sites must be visited (arrival time) between 9am (0) and the horizon
         for location_idx in range(len(sites)):
             index = manager.NodeToIndex(location_idx)
-            # Time window: must arrive between 0 (9am) and 480 (5pm)
-            time_dimension.CumulVar(index).SetRange(0, 480)
+            time_dimension.CumulVar(index).SetRange(0, horizon_minutes)
         
         # Set search parameters
         search_parameters = pywrapcp.DefaultRoutingSearchParameters()
-        search_parameters.first_solution_strategy = (
-            routing_enums_pb2.FirstSolutionStrategy.PATH_CHEAPEST_ARC
-        )
-        search_parameters.local_search_metaheuristic = (
-            routing_enums_pb2.LocalSearchMetaheuristic.GUIDED_LOCAL_SEARCH
-        )
+        if first_solution_strategy is None:
+            first_solution_strategy = routing_enums_pb2.FirstSolutionStrategy.AUTOMATIC
+        search_parameters.first_solution_strategy = first_solution_strategy
+        if metaheuristic is None:
+            metaheuristic = routing_enums_pb2.LocalSearchMetaheuristic.GENERIC_TABU_SEARCH
+        search_parameters.local_search_metaheuristic = metaheuristic
         search_parameters.time_limit.seconds = self.time_limit_seconds
         
+        # Warm-start from the previous solve when its routes still cover exactly
+        # these sites; otherwise (or if they are no longer feasible) start fresh
+        initial_solution = None
+        if previous_routes and len(previous_routes) <= num_vehicles:
+            depot_id = sites[0].id
+            node_of = {site.id: node for node, site in enumerate(sites)}
+            visits = [[site_id for site_id in seq if site_id != depot_id] for seq in previous_routes]
+            if sorted(site_id for seq in visits for site_id in seq) == sorted(s.id for s in sites[1:]):
+                initial_solution = routing.ReadAssignmentFromRoutes(
+                    [[manager.NodeToIndex(node_of[site_id]) for site_id in seq] for seq in visits],
+                    True
+                )
+        
         # Solve the problem
-        solution = routing.SolveWithParameters(search_parameters)
+        if initial_solution:
+            log("  Warm-starting from the previous solution")
+            solution = routing.SolveFromAssignmentWithParameters(initial_solution, search_parameters)
+        else:
+            solution = routing.SolveWithParameters(search_parameters)
         
         if not solution:
             if log_callback:
@@ -304,6 +482,7 @@ class SolveService:
             
             # Move to next node
             previous_index = index
+            previous_node = depot_node
             index = solution.Value(routing.NextVar(index))
             
             # Visit all remaining nodes in the route
@@ -312,9 +491,10 @@ class SolveService:
                 sequence.append(sites[node].id)
                 
                 # Calculate distance from previous to current
-                total_distance_miles += distance_matrix[manager.IndexToNode(previous_index)][manager.IndexToNode(index)]
+                total_distance_miles += distance_matrix[previous_node, node]
                 
                 previous_index = index
+                previous_node = node
                 index = solution.Value(routing.NextVar(index))
             
             # Skip empty routes (vehicle not used)
@@ -322,14 +502,9 @@ class SolveService:
                 continue
             
             # Get actual total time from the solver (in minutes)
-            # This is the time at the last node visited for this vehicle
-            final_index = routing.Start(vehicle_id)
-            last_index = final_index
-            while not routing.IsEnd(final_index):
-                last_index = final_index
-                final_index = solution.Value(routing.NextVar(final_index))
-            
-            final_time_var = time_dimension.CumulVar(last_index)
+            # This is the time at the last node visited for this vehicle,
+            # which the walk above left in previous_index
+            final_time_var = time_dimension.CumulVar(previous_index)
             total_time_minutes = solution.Value(final_time_var)
             total_hours = total_time_minutes / 60.0
             
@@ -347,57 +522,23 @@ class SolveService:
         
         return routes
     
-    def _create_distance_matrix(self, sites: list) -> list[list[float]]:
+    def _create_distance_matrix(self, sites: list) -> np.ndarray:
         """
         Create a distance matrix between all sites using Haversine formula.
         
+        The whole matrix is computed by one kernel call over the coordinate
+        arrays rather than one pair at a time.
+        
         Args:
             sites: List of sites with lat/lng coordinates
             
         Returns:
-            2D matrix of distances in miles
+            (n, n) array of distances in miles
         """
         n = len(sites)
-        matrix = [[0.0] * n for _ in range(n)]
-        
-        for i in range(n):
-            for j in range(n):
-                if i != j:
-                    matrix[i][j] = self._haversine_distance(
-                        sites[i].lat, sites[i].lng,
-                        sites[j].lat, sites[j].lng
-                    )
-        
-        return matrix
-    
-    def _haversine_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        """
-        Calculate the great circle distance between two points on Earth.
-        
-        Args:
-            lat1, lon1: Latitude and longitude of first point
-            lat2, lon2: Latitude and longitude of second point
-            
-        Returns:
-            Distance in miles
-        """
-        # Earth radius in miles
-        R = 3959.0
-        
-        # Convert to radians
-        lat1_rad = math.radians(lat1)
-        lon1_rad = math.radians(lon1)
-        lat2_rad = math.radians(lat2)
-        lon2_rad = math.radians(lon2)
-        
-        # Haversine formula
-        dlat = lat2_rad - lat1_rad
-        dlon = lon2_rad - lon1_rad
-        
-        a = math.sin(dlat / 2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2)**2
-        c = 2 * math.asin(math.sqrt(a))
-        
-        return R * c
+        lat = np.radians(np.fromiter((s.lat for s in sites), dtype=np.float64, count=n))
+        lng = np.radians(np.fromiter((s.lng for s in sites), dtype=np.float64, count=n))
+        return haversine_matrix(lat, lng)
     
     def generate_solution_table_data(self, problem: ProblemState, routes: list[Route]) -> list[list[str]]:
         """
@@ -415,57 +556,62 @@ class SolveService:
         from datetime import datetime, timedelta
         
         table_data = []
-        site_lookup = {s.id: s for s in problem.sites}
+        site_lookup = problem.site_by_id
         
         for route_idx, route in enumerate(routes, 1):
+            if not route.sequence:
+                continue
+            
             # Start time for this route (9:00 AM)
-            current_time = datetime.now().replace(hour=9, minute=0, second=0, microsecond=0)
+            start_time = datetime.now().replace(hour=9, minute=0, second=0, microsecond=0)
             
             # Get service time in minutes (convert from hours)
-            service_time_minutes = (route.service_hours / len(route.sequence)) * 60 if route.sequence else 0
+            service_time_minutes = (route.service_hours / len(route.sequence)) * 60
             
-            for stop_seq, site_id in enumerate(route.sequence):
-                site = site_lookup.get(site_id)
-                
-                # Calculate travel time and distance to next stop
-                travel_time_min = ""
-                distance_miles = ""
-                if stop_seq < len(route.sequence) - 1:
-                    next_site_id = route.sequence[stop_seq + 1]
-                    next_site = site_lookup.get(next_site_id)
-                    if site and next_site and site.lat and site.lng and next_site.lat and next_site.lng:
-                        distance = self._haversine_distance(site.lat, site.lng, next_site.lat, next_site.lng)
-                        travel_time = (distance / route.speed_mph) * 60  # Convert to minutes
-                        travel_time_min = f"{travel_time:.2f}"
-                        distance_miles = f"{distance:.2f}"
-                
-                # Calculate times
-                arrival_time_str = current_time.strftime("%I:%M %p")
-                departure_time = current_time + timedelta(minutes=service_time_minutes)
-                departure_time_str = departure_time.strftime("%I:%M %p")
+            # Coordinates for every stop; unknown sites and missing (or zero)
+            # coordinates are NaN and produce no leg
+            stops = [site_lookup.get(site_id) for site_id in route.sequence]
+            lats = np.array([s.lat if s and s.lat else np.nan for s in stops], dtype=np.float64)
+            lngs = np.array([s.lng if s and s.lng else np.nan for s in stops], dtype=np.float64)
+            
+            # All consecutive legs in one vectorized pass
+            lat_rad = np.radians(lats)
+            lng_rad = np.radians(lngs)
+            distances = haversine_pairwise(lat_rad[:-1], lng_rad[:-1], lat_rad[1:], lng_rad[1:])
+            travel_times = distances / route.speed_mph * 60  # Convert to minutes
+            has_leg = ~np.isnan(distances)
+            distance_strs = np.where(has_leg, np.char.mod("%.2f", distances), "").tolist() + [""]
+            travel_strs = np.where(has_leg, np.char.mod("%.2f", travel_times), "").tolist() + [""]
+            
+            # Each stop starts after the previous stops' service and travel time
+            legs = np.where(has_leg, travel_times, 0.0)
+            offsets = np.concatenate(([0.0], np.cumsum(legs + service_time_minutes)))
+            
+            route_id = str(route_idx)
+            cluster_id = str(route.cluster_id)
+            vehicle_id = str(route.vehicle_id)
+            service_str = f"{service_time_minutes:.1f}"
+            service_delta = timedelta(minutes=service_time_minutes)
+            
+            for stop_seq, (site_id, site) in enumerate(zip(route.sequence, stops)):
+                arrival_time = start_time + timedelta(minutes=float(offsets[stop_seq]))
+                departure_time = arrival_time + service_delta
                 
                 # Create row
-                row = [
-                    str(route_idx),                                                    # route_id
+                table_data.append([
+                    route_id,                                                          # route_id
                     str(stop_seq),                                                     # stop_sequence
                     site_id,                                                           # site_id
-                    str(route.cluster_id),                                            # cluster_id
-                    str(route.vehicle_id),                                            # vehicle_id
+                    cluster_id,                                                        # cluster_id
+                    vehicle_id,                                                        # vehicle_id
                     f"{site.lat:.6f}" if site and site.lat else "",                  # lat
                     f"{site.lng:.6f}" if site and site.lng else "",                  # lng
-                    arrival_time_str,                                                  # arrival_time
-                    departure_time_str,                                                # departure_time
-                    f"{service_time_minutes:.1f}",                                    # service_time_min
-                    travel_time_min,                                                   # travel_time_min
-                    distance_miles                                                     # distance_miles
-                ]
-                table_data.append(row)
-                
-                # Update current time for next stop
-                if travel_time_min:
-                    current_time = departure_time + timedelta(minutes=float(travel_time_min))
-                else:
-                    current_time = departure_time
+                    arrival_time.strftime("%I:%M %p"),                                # arrival_time
+                    departure_time.strftime("%I:%M %p"),                              # departure_time
+                    service_str,                                                       # service_time_min
+                    travel_strs[stop_seq],                                             # travel_time_min
+                    distance_strs[stop_seq]                                            # distance_miles
+                ])
         
         return table_data
     
@@ -485,6 +631,7 @@ class SolveService:
                 log_callback(msg)
         
         solution_path = problem.paths.solution_csv()
+        invalidate_workspace_cache(solution_path)
         
         # Ensure parent directory exists
         solution_path.parent.mkdir(parents=True, exist_ok=True)
@@ -499,25 +646,10 @@ class SolveService:
                 'lat', 'lng', 'arrival_time', 'departure_time',
                 'service_time_min', 'travel_time_min', 'distance_miles'
             ]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            # Write each row
-            for row in table_data:
-                writer.writerow({
-                    'route_id': row[0],
-                    'stop_sequence': row[1],
-                    'site_id': row[2],
-                    'cluster_id': row[3],
-                    'vehicle_id': row[4],
-                    'lat': row[5],
-                    'lng': row[6],
-                    'arrival_time': row[7],
-                    'departure_time': row[8],
-                    'service_time_min': row[9],
-                    'travel_time_min': row[10],
-                    'distance_miles': row[11]
-                })
+            # Rows are already ordered to match fieldnames
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            writer.writerows(table_data)
         
         log(f"Solution saved to {solution_path}")
         
@@ -525,3 +657,10 @@ class SolveService:
         problem.routes = routes
         from models.planning_stage import PlanningStage
         problem.stage = PlanningStage.SOLVED
+
+
+def _solve_cluster(time_limit_seconds: int, job: dict) -> tuple[list[Route], list[str]]:
+    """Solve one cluster in a worker process, collecting its log lines."""
+    messages = []
+    routes = SolveService(time_limit_seconds)._solve_single_route(log_callback=messages.append, **job)
+    return routes, messages
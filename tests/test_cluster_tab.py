@@ -66,6 +66,7 @@ Site6,333 Cedar Rd,CA,34.0722,-118.2237,Los Angeles""")
             prefs = json.load(f)
         
         assert prefs['algorithm'] == 'kmeans'
+        assert prefs['engine'] in ('elkan', 'minibatch', 'lloyd_3d')
         assert prefs['k'] == 3
         assert prefs['selection'] == 'manual'
         assert prefs['seed'] == 42
@@ -195,3 +196,211 @@ Site5,222 Maple Ave,CA,34.0622,-118.2337,Los Angeles,invalid""")
         assert 1 in problem.clusters
         assert len(problem.clusters[0]) == 1
         assert len(problem.clusters[1]) == 1
+    
+    def test_site_table_round_trip(self):
+        """
+        Test that SiteTable keeps coordinates as contiguous arrays and round-trips sites.
+        """
+        import numpy as np
+        from models.site import Site
+        from models.site_table import SiteTable
+        
+        # GIVEN: Sites with and without coordinates / cluster assignments
+        sites = [
+            Site(id="Site1", address="123 Main St", state_code="CA", lat=37.7749, lng=-122.4194, cluster_id=0),
+            Site(id="Site2", address="456 Oak Ave", state_code="CA"),
+        ]
+        
+        # WHEN: Build the structure-of-arrays table
+        table = SiteTable.from_sites(sites)
+        
+        # THEN: Coordinates are an (n, 2) float array with NaN for missing values
+        coords = table.coordinates()
+        assert coords.shape == (2, 2)
+        assert coords.dtype == np.float32
+        assert coords[0].tolist() == pytest.approx([37.7749, -122.4194], abs=1e-5)
+        assert np.isnan(coords[1]).all()
+        assert list(table.cluster_ids) == [0, -1]
+        
+        # THEN: Indexing materializes equivalent Site objects
+        assert len(table) == 2
+        assert table[0].id == "Site1"
+        assert table[0].lat == pytest.approx(37.7749, abs=1e-5)
+        assert table[0].cluster_id == 0
+        assert table[1] == sites[1]
+    
+    def test_from_workspace_reuses_unchanged_clustered_csv(self, problem_state_workspace):
+        """
+        Test that re-hydrating an unchanged workspace returns an independent copy
+        and that rewriting clustered.csv is picked up.
+        """
+        # GIVEN: A clustered workspace loaded once and then mutated in memory
+        base_dir, state_dir = problem_state_workspace
+        
+        clustered_csv = state_dir / "clustered.csv"
+        clustered_csv.write_text("""SiteID,Address,State,Lat,Lng,DisplayName,cluster_id
+Site1,123 Main St,CA,37.7749,-122.4194,San Francisco,0
+Site2,456 Oak Ave,CA,37.7849,-122.4094,San Francisco,1""")
+        
+        def load():
+            return ProblemState.from_workspace(
+                client="test_client",
+                workspace="test_workspace",
+                entity_type="site",
+                state_code="CA",
+                base_dir=base_dir
+            )
+        
+        first = load()
+        first.sites[0].cluster_id = 5
+        
+        # WHEN: Hydrating again without touching the files
+        second = load()
+        
+        # THEN: The in-memory mutation does not leak into the new state
+        assert second.sites[0].cluster_id == 0
+        assert second.clusters[0][0] is second.sites[0]
+        
+        # WHEN: clustered.csv is rewritten
+        from models.problem_state import save_clustered_csv
+        second.sites[0].cluster_id = 1
+        save_clustered_csv(clustered_csv, second.sites)
+        
+        # THEN: The next hydrate reflects the new file
+        third = load()
+        assert third.sites[0].cluster_id == 1
+        assert len(third.clusters[1]) == 2
+
+    def test_clustered_csv_bytes_do_not_depend_on_pyarrow(self, temp_workspace, monkeypatch):
+        """
+        Test that the pyarrow writer produces the same file as pandas' to_csv.
+        """
+        pytest.importorskip("pyarrow")
+        from models import problem_state
+        from models.site import Site
+
+        # GIVEN: Sites with text that needs quoting, a whole-number coordinate and a missing one
+        sites = [
+            Site(id="003", address='1 Main St, Suite "A"', state_code="CA", lat=37.0, lng=-122.4194, cluster_id=0),
+            Site(id="Site2", address="456 Oak Ave", state_code="CA", lat=None, lng=None, cluster_id=-1),
+        ]
+
+        # WHEN: Saving clustered.csv with each engine
+        written = {}
+        for engine in ("pyarrow", "c"):
+            monkeypatch.setattr(problem_state, "CSV_ENGINE", engine)
+            path = temp_workspace / f"{engine}.csv"
+            problem_state.save_clustered_csv(path, sites)
+            written[engine] = path.read_bytes()
+
+        # THEN: The files are byte-for-byte identical
+        assert written["pyarrow"] == written["c"]
+        assert written["c"].startswith(b'SiteID,Address,State,Lat,Lng,DisplayName,cluster_id\n003,"1 Main St, Suite ""A""",CA,37.0,')
+
+    def test_workspace_cache_is_bounded(self, temp_workspace):
+        """
+        Test that the hydrate cache keeps only the most recently used workspaces.
+        """
+        from models import problem_state
+
+        # GIVEN: More state directories than the cache holds
+        problem_state._workspace_cache.clear()
+        state_codes = [f"S{i}" for i in range(problem_state._WORKSPACE_CACHE_SIZE + 2)]
+        for state_code in state_codes:
+            state_dir = temp_workspace / "c" / "w" / state_code
+            state_dir.mkdir(parents=True)
+            (state_dir / "addresses.csv").write_text(f"site_id,address1,city,state,zip\nSite1,1 Main St,Town,{state_code},00001\n")
+
+        # WHEN: Hydrating each of them
+        for state_code in state_codes:
+            ProblemState.from_workspace("c", "w", "site", state_code, temp_workspace)
+
+        # THEN: Only the most recent ones are retained
+        cached = [key[0].name for key in problem_state._workspace_cache]
+        assert cached == state_codes[-problem_state._WORKSPACE_CACHE_SIZE:]
+    
+    def test_coords_array_is_memoized_until_sites_change(self):
+        """
+        Test that ProblemState.coords_array is reused and rebuilt on invalidation.
+        """
+        from models.site import Site
+        
+        # GIVEN: A problem with one located and one unlocated site
+        problem = ProblemState(client="c", workspace="w", entity_type="site", state_code="CA")
+        problem.sites = [
+            Site(id="Site1", address="123 Main St", state_code="CA", lat=37.7749, lng=-122.4194),
+            Site(id="Site2", address="456 Oak Ave", state_code="CA"),
+        ]
+        
+        # WHEN: Reading the matrix twice
+        coords = problem.coords_array
+        
+        # THEN: Only located sites are included and the array is reused
+        assert coords.tolist() == [[37.7749, -122.4194]]
+        assert problem.coords_array is coords
+        
+        # WHEN: A site is geocoded in place and the cache invalidated
+        problem.sites[1].lat, problem.sites[1].lng = 37.7849, -122.4094
+        problem.invalidate_coords()
+        
+        # THEN: The rebuilt matrix includes it
+        assert problem.coords_array.shape == (2, 2)
+
+        # WHEN: sites is reassigned to a same-length list
+        problem.sites = [
+            Site(id="Site3", address="1 Elm St", state_code="CA", lat=34.0522, lng=-118.2437),
+            Site(id="Site4", address="2 Elm St", state_code="CA", lat=34.0622, lng=-118.2537),
+        ]
+
+        # THEN: The memos are rebuilt without an explicit invalidation
+        assert problem.coords_array.tolist()[0] == [34.0522, -118.2437]
+        assert set(problem.site_by_id) == {"Site3", "Site4"}
+    
+    def test_lloyd_3d_kernel_separates_groups(self):
+        """
+        Test that the fixed-dimension k-means kernel recovers well separated groups.
+        """
+        import numpy as np
+        from services._kmeans3d import kmeans_pp_3d, lloyd_3d
+        
+        # GIVEN: Two tight groups of points far apart
+        rng = np.random.default_rng(0)
+        points = np.vstack([
+            rng.normal([1.0, 0.0, 0.0], 0.01, size=(20, 3)),
+            rng.normal([0.0, 1.0, 0.0], 0.01, size=(20, 3)),
+        ])
+        
+        # WHEN: Seeding with k-means++ and running Lloyd
+        centers = kmeans_pp_3d(points, 2, rng.random(2))
+        labels, centers = lloyd_3d(points, centers, 100, 1e-12)
+        
+        # THEN: Each group gets a single, distinct label
+        assert len(set(labels[:20])) == 1
+        assert len(set(labels[20:])) == 1
+        assert labels[0] != labels[20]
+        assert centers.shape == (2, 3)
+    
+    def test_auto_k_finds_elbow(self):
+        """
+        Test that auto selection picks K at the inertia elbow for well separated groups.
+        """
+        import numpy as np
+        from models.site import Site
+        from services.cluster_service import ClusterService
+        
+        # GIVEN: Four tight groups of sites around California cities
+        rng = np.random.default_rng(0)
+        centers = [(34.0, -118.0), (37.7, -122.4), (32.7, -117.1), (38.5, -121.5)]
+        problem = ProblemState(client="c", workspace="w", entity_type="site", state_code="CA")
+        problem.sites = [
+            Site(id=f"S{i}", address="a", state_code="CA",
+                 lat=lat + rng.normal(0, 0.1), lng=lng + rng.normal(0, 0.1))
+            for i, (lat, lng) in enumerate(c for c in centers for _ in range(30))
+        ]
+        
+        # WHEN: Clustering with automatic K
+        ClusterService().cluster_problem(problem, selection="auto")
+        
+        # THEN: One cluster per group
+        assert len(problem.clusters) == 4
+        assert sorted(len(members) for members in problem.clusters.values()) == [30, 30, 30, 30]
@@ -312,3 +312,165 @@ Site2,456 Oak Ave,New York,NY,10001""")
         assert sites[1].id == "Site2"
         assert sites[1].lat is not None
         assert sites[1].lng is not None
+
+    def test_load_geocoded_table(self, temp_workspace):
+        """
+        Test bulk-loading geocoded.csv into column arrays without Site objects.
+        """
+        from models.problem_state import load_geocoded_table
+        
+        # GIVEN: A geocoded.csv with one site missing coordinates
+        geocoded_csv = temp_workspace / "geocoded.csv"
+        geocoded_csv.write_text("""SiteID,Address,State,Lat,Lng,DisplayName
+Site1,123 Main St,CA,37.7749,-122.4194,San Francisco
+Site2,456 Oak Ave,CA,,,San Francisco""")
+        
+        # WHEN: Load as a SiteTable
+        table = load_geocoded_table(geocoded_csv)
+        
+        # THEN: Columns line up with the file and missing coordinates are NaN
+        assert len(table) == 2
+        assert list(table.ids) == ["Site1", "Site2"]
+        assert list(table.states) == ["CA", "CA"]
+        assert table.lats[0] == pytest.approx(37.7749, abs=1e-5)
+        assert table.lngs[0] == pytest.approx(-122.4194, abs=1e-5)
+        assert table[1].lat is None
+        assert list(table.cluster_ids) == [-1, -1]
+
+    def test_loaders_keep_numeric_looking_text(self, temp_workspace):
+        """
+        Test that IDs and address parts with leading zeros load verbatim.
+        """
+        from models.problem_state import load_addresses_csv, load_geocoded_table
+
+        # GIVEN: addresses.csv and geocoded.csv whose ID and address text look numeric
+        addresses_csv = temp_workspace / "addresses.csv"
+        addresses_csv.write_text("""site_id,address1,city,state,zip
+003,02101,Boston,MA,02101""")
+        geocoded_csv = temp_workspace / "geocoded.csv"
+        geocoded_csv.write_text("""SiteID,Address,State,Lat,Lng,DisplayName
+003,02101,MA,42.3601,-71.0589,Boston""")
+
+        # WHEN: Load through each loader
+        address_sites = load_addresses_csv(addresses_csv)
+        geocoded_sites = load_geocoded_csv(geocoded_csv)
+        table = load_geocoded_table(geocoded_csv)
+
+        # THEN: Leading zeros survive in every loader
+        assert address_sites[0].id == "003"
+        assert address_sites[0].address == "02101, Boston"
+        assert geocoded_sites[0].id == "003"
+        assert geocoded_sites[0].address == "02101"
+        assert list(table.ids) == ["003"]
+        assert list(table.addresses) == ["02101"]
+
+    def test_loaders_agree_on_site_ids(self, temp_workspace):
+        """
+        Test that every artifact loader reads the same IDs for the same sites.
+        """
+        from models.problem_state import load_addresses_csv, load_clustered_csv, load_geocoded_table
+
+        # GIVEN: The same numeric-looking IDs in each artifact
+        ids = ["003", "0100", "12", "A7"]
+        addresses_csv = temp_workspace / "addresses.csv"
+        addresses_csv.write_text("site_id,address1,city,state,zip\n" + "".join(
+            f"{site_id},1 Main St,Boston,MA,02101\n" for site_id in ids
+        ))
+        geocoded_csv = temp_workspace / "geocoded.csv"
+        geocoded_csv.write_text("SiteID,Address,State,Lat,Lng,DisplayName\n" + "".join(
+            f"{site_id},1 Main St,MA,42.36,-71.05,Boston\n" for site_id in ids
+        ))
+        clustered_csv = temp_workspace / "clustered.csv"
+        clustered_csv.write_text("SiteID,Address,State,Lat,Lng,DisplayName,cluster_id\n" + "".join(
+            f"{site_id},1 Main St,MA,42.36,-71.05,Boston,0\n" for site_id in ids
+        ))
+
+        # WHEN: Load through each loader
+        clustered_sites, _ = load_clustered_csv(clustered_csv)
+
+        # THEN: All loaders return identical IDs
+        assert [site.id for site in load_addresses_csv(addresses_csv)] == ids
+        assert [site.id for site in load_geocoded_csv(geocoded_csv)] == ids
+        assert list(load_geocoded_table(geocoded_csv).ids) == ids
+        assert [site.id for site in clustered_sites] == ids
+
+    def test_geocode_cache_get_many(self, temp_workspace):
+        """
+        Test that batched cache lookups return only pairs with valid coordinates.
+        """
+        # GIVEN: A cache with one successful and one failed entry
+        cache = GeocodeCache(str(temp_workspace / "test_cache.db"))
+        cache.set_many([
+            ("123 Main St", "CA", 37.7749, -122.4194, "San Francisco"),
+            ("Nowhere", "CA", None, None, None),
+        ])
+        
+        # WHEN: Looking up both plus an uncached address
+        hits = cache.get_many([("123 Main St", "CA"), ("Nowhere", "CA"), ("456 Oak Ave", "CA")])
+        
+        # THEN: Only the successful entry is returned
+        assert list(hits) == [("123 Main St", "CA")]
+        assert hits[("123 Main St", "CA")] == cache.get("123 Main St", "CA")
+        cache.close()
+
+    def test_geocode_cache_normalizes_addresses(self, temp_workspace):
+        """
+        Test that address spelling variants share a cache entry, including pre-normalization databases.
+        """
+        import sqlite3
+        
+        # GIVEN: A cache database written before keys were normalized
+        cache_path = temp_workspace / "test_cache.db"
+        conn = sqlite3.connect(cache_path)
+        conn.execute("""CREATE TABLE geocode_cache (
+            address TEXT NOT NULL, state_code TEXT NOT NULL, lat REAL, lng REAL,
+            display_name TEXT, timestamp TEXT NOT NULL, PRIMARY KEY (address, state_code))""")
+        conn.execute("INSERT INTO geocode_cache VALUES ('123 Main St, San Francisco', 'CA', 37.7749, -122.4194, 'SF', '2024-01-01T00:00:00')")
+        conn.commit()
+        conn.close()
+        
+        # WHEN: Opening the cache and looking up variants of the address
+        cache = GeocodeCache(str(cache_path))
+        
+        # THEN: Case, whitespace, punctuation and suffix abbreviations don't matter
+        assert cache.get("123 main street,  San Francisco ", "ca")['lat'] == 37.7749
+        hits = cache.get_many([("123 Main St., San Francisco", "CA"), ("123 MAIN ST, SAN FRANCISCO", "CA")])
+        assert len(hits) == 2
+        cache.close()
+
+    def test_geocode_deduplicates_shared_addresses(self, problem_state_workspace):
+        """
+        Test that sites sharing an address are geocoded once and all receive the result.
+        """
+        # GIVEN: Two sites at the same address and one elsewhere
+        base_dir, state_dir = problem_state_workspace
+        cache_path = state_dir / "test_cache.db"
+        
+        addresses_csv = state_dir / "addresses.csv"
+        addresses_csv.write_text("""site_id,address1,city,state,zip
+Site1,123 Main St,San Francisco,CA,94102
+Site2,123 Main St,San Francisco,CA,94102
+Site3,456 Oak Ave,San Francisco,CA,94102""")
+        
+        problem = ProblemState.from_workspace(
+            client="test_client",
+            workspace="test_workspace",
+            entity_type="site",
+            state_code="CA",
+            base_dir=base_dir
+        )
+        
+        class CountingGeocoder(MockGeocoder):
+            def geocode(self, sites, log_callback=None):
+                self.requested = [site.id for site in sites]
+                return super().geocode(sites, log_callback)
+        
+        # WHEN: Geocode the sites
+        geocoder = CountingGeocoder()
+        service = GeocodeService(geocoder, cache_path=str(cache_path))
+        service.geocode_problem(problem)
+        
+        # THEN: Only one request per distinct address, and the duplicate shares its coordinates
+        assert geocoder.requested == ["Site1", "Site3"]
+        assert (problem.sites[1].lat, problem.sites[1].lng) == (problem.sites[0].lat, problem.sites[0].lng)
+        assert problem.sites[1].display_name == problem.sites[0].display_name
@@ -4,7 +4,8 @@ Tests the complete workflow of parsing CSV files into ProblemState.
 """
 import pytest
 from pathlib import Path
-from models.problem_state import load_addresses_csv
+from models.planning_stage import PlanningStage
+from models.problem_state import ProblemState, load_addresses_csv
 from services.parse_service import ParseService
 
 # ParseTab does not use ProblemState. It just parses Excel file and populates columns' loc,street1,street2,city,st,zip in addresses.csv by state.
@@ -106,5 +107,72 @@ Site1,123 Main St,San Francisco"""
         # THEN: Should raise ValueError for missing state column
         with pytest.raises(ValueError, match="missing 'state' column"):
             load_addresses_csv(csv_path2)
+
+    def test_load_parsed_states_concurrently(self, temp_workspace):
+        """
+        Test hydrating every parsed state at once with from_workspace_many.
+        """
+        # GIVEN: acme.xlsx parsed into a client/workspace directory
+        test_dir = Path(__file__).parent
+        parse_service = ParseService(test_dir / "config" / "acme.yml")
+        state_counts = parse_service.parse_excel(
+            test_dir / "data" / "acme.xlsx", "Sheet1", temp_workspace / "acme" / "phones"
+        )
+        
+        # WHEN: All states are loaded concurrently
+        states = ProblemState.from_workspace_many(
+            client="acme",
+            workspace="phones",
+            entity_type="site",
+            state_codes=state_counts.keys(),
+            base_dir=temp_workspace
+        )
+        
+        # THEN: Each state is hydrated from its own addresses.csv
+        assert list(states) == list(state_counts)
+        for state_code, problem in states.items():
+            assert problem.stage == PlanningStage.ADDRESSES
+            assert len(problem.sites) == state_counts[state_code]
+            assert all(site.state_code == state_code for site in problem.sites)
+
+    def test_fastexcel_reader_matches_openpyxl(self, temp_workspace, monkeypatch):
+        """
+        Test that the fastexcel reader writes the same CSVs as the openpyxl reader.
+        """
+        pytest.importorskip("fastexcel")
+        
+        # GIVEN/WHEN: acme.xlsx parsed once with each reader
+        fast = _parse_acme_with(monkeypatch, temp_workspace / "fastexcel", fastexcel=True, calamine=False)
+        baseline = _parse_acme_with(monkeypatch, temp_workspace / "openpyxl", fastexcel=False, calamine=False)
+        
+        # THEN: Every state's addresses.csv is byte-for-byte identical
+        assert fast and fast == baseline
+
+    def test_calamine_reader_matches_openpyxl(self, temp_workspace, monkeypatch):
+        """
+        Test that the calamine reader writes the same CSVs as the openpyxl reader.
+        """
+        pytest.importorskip("python_calamine")
+        
+        # GIVEN/WHEN: acme.xlsx parsed once with each reader
+        calamine = _parse_acme_with(monkeypatch, temp_workspace / "calamine", fastexcel=False, calamine=True)
+        baseline = _parse_acme_with(monkeypatch, temp_workspace / "openpyxl", fastexcel=False, calamine=False)
+        
+        # THEN: Every state's addresses.csv is byte-for-byte identical
+        assert calamine and calamine == baseline
+
+
+def _parse_acme_with(monkeypatch, output_path: Path, fastexcel: bool, calamine: bool) -> dict:
+    """Parse acme.xlsx with the chosen readers enabled; return {relative path: CSV bytes}."""
+    import services.parse_service as parse_module
     
-    
\ No newline at end of file
+    monkeypatch.setattr(parse_module, "FASTEXCEL_AVAILABLE", fastexcel)
+    monkeypatch.setattr(parse_module, "CALAMINE_AVAILABLE", calamine)
+    test_dir = Path(__file__).parent
+    ParseService(test_dir / "config" / "acme.yml").parse_excel(
+        test_dir / "data" / "acme.xlsx", "Sheet1", output_path
+    )
+    return {
+        csv_path.relative_to(output_path): csv_path.read_bytes()
+        for csv_path in sorted(output_path.rglob("*.csv"))
+    }
@@ -2,45 +2,177 @@
 Integration tests for Solve Tab functionality.
 Tests the complete workflow of solving routing problems.
 """
+import numpy as np
 import pytest
 from pathlib import Path
 from datetime import datetime
 from models.problem_state import ProblemState
 from models.route import Route
 from models.site import Site
+from services._haversine import haversine_pairwise
 from services.solve_service import SolveService
 
 
+def _haversine_degrees(lat1, lng1, lat2, lng2):
+    """Great-circle miles between two points given in degrees."""
+    return float(haversine_pairwise(*np.radians([lat1, lng1, lat2, lng2])))
+
+
 class TestSolveTab:
     """Integration tests for solve tab operations."""
     
     def test_haversine_distance_calculation(self):
         """Test that haversine distance calculation is accurate."""
-        service = SolveService(time_limit_seconds=30)
-        
         # GIVEN: San Francisco to Los Angeles (approx 347 miles)
         sf_lat, sf_lng = 37.7749, -122.4194
         la_lat, la_lng = 34.0522, -118.2437
         
         # WHEN: Calculate distance
-        distance = service._haversine_distance(sf_lat, sf_lng, la_lat, la_lng)
+        distance = _haversine_degrees(sf_lat, sf_lng, la_lat, la_lng)
         
         # THEN: Should be approximately 347 miles (within 10 miles tolerance)
         assert 337 <= distance <= 357, f"Expected ~347 miles, got {distance:.2f}"
     
     def test_haversine_distance_same_point(self):
         """Test that distance between same point is zero."""
-        service = SolveService(time_limit_seconds=30)
-        
         # GIVEN: Same point
         lat, lng = 37.7749, -122.4194
 
         # WHEN: Calculate distance
-        distance = service._haversine_distance(lat, lng, lat, lng)
+        distance = _haversine_degrees(lat, lng, lat, lng)
         
         # THEN: Should be zero
         assert distance == 0.0
     
+    def test_distance_matrix_matches_pairwise_haversine(self):
+        """Test that the vectorized distance matrix matches per-pair haversine."""
+        service = SolveService(time_limit_seconds=30)
+        
+        # GIVEN: A handful of sites spread across the US
+        coords = [(37.7749, -122.4194), (34.0522, -118.2437), (40.7128, -74.0060), (35.2271, -80.8431)]
+        sites = [
+            Site(id=f"Site{i}", address="", state_code="XX", lat=lat, lng=lng)
+            for i, (lat, lng) in enumerate(coords)
+        ]
+        
+        # WHEN: Build the distance matrix
+        matrix = service._create_distance_matrix(sites)
+        
+        # THEN: Every entry should match the scalar formula, with a zero diagonal
+        for i, (lat1, lng1) in enumerate(coords):
+            for j, (lat2, lng2) in enumerate(coords):
+                expected = 0.0 if i == j else _haversine_degrees(lat1, lng1, lat2, lng2)
+                assert matrix[i, j] == pytest.approx(expected)
+    
+    def test_solve_clusters_in_parallel_keeps_cluster_order(self):
+        """Test that clusters solved in worker processes come back in job order."""
+        service = SolveService(time_limit_seconds=1, max_workers=2)
+        
+        # GIVEN: Two small clusters far apart
+        def cluster(cluster_id, lat, lng):
+            sites = [
+                Site(id=f"C{cluster_id}-{i}", address="", state_code="CA",
+                     lat=lat + 0.01 * i, lng=lng - 0.01 * i, cluster_id=cluster_id)
+                for i in range(4)
+            ]
+            return dict(state_code="CA", cluster_id=cluster_id, sites=sites,
+                        service_time_hours=0.5, speed_mph=50.0, first_solution_strategy=None)
+        jobs = [cluster(1, 37.77, -122.42), cluster(2, 34.05, -118.24)]
+        
+        # WHEN: Solve both clusters through the process pool
+        results = list(service._solve_clusters(jobs))
+        
+        # THEN: Each result belongs to its job and visits every site once
+        assert len(results) == 2
+        for job, (routes, messages) in zip(jobs, results):
+            assert all(r.cluster_id == job["cluster_id"] for r in routes)
+            visited = sorted(site_id for r in routes for site_id in r.sequence)
+            assert visited == sorted(s.id for s in job["sites"])
+            assert messages
+    
+    def test_resolve_warm_starts_from_previous_routes(self):
+        """Test that re-solving the same sites starts from the previous routes."""
+        service = SolveService(time_limit_seconds=1)
+        
+        # GIVEN: A cluster needing more than one vehicle that has already been solved once
+        sites = [
+            Site(id=f"Site{i}", address="", state_code="CA", lat=37.77 + 0.01 * i, lng=-122.42 + 0.01 * i)
+            for i in range(10)
+        ]
+        first = service._solve_single_route("CA", 1, sites, 0.5, 50.0)
+        
+        # WHEN: Solve again, passing the previous sequences
+        messages = []
+        second = service._solve_single_route(
+            "CA", 1, sites, 0.5, 50.0,
+            log_callback=messages.append,
+            previous_routes=[r.sequence for r in first]
+        )
+        
+        # THEN: The solver should warm-start and still visit every site
+        # (every vehicle's sequence starts at the depot)
+        assert any("Warm-starting" in msg for msg in messages)
+        assert {site_id for r in second for site_id in r.sequence} == {s.id for s in sites}
+    
+    def test_resolve_after_reload_warm_starts(self, problem_state_workspace):
+        """Test that routes loaded from solution.csv warm-start the next solve."""
+        base_dir, state_dir = problem_state_workspace
+        service = SolveService(time_limit_seconds=1, max_workers=1)
+        
+        # GIVEN: A clustered workspace that has been solved and saved once
+        rows = "".join(
+            f"Site{i},{i} Main St,CA,{37.77 + 0.01 * i},{-122.42 + 0.01 * i},Town,1\n"
+            for i in range(10)
+        )
+        (state_dir / "clustered.csv").write_text(
+            "SiteID,Address,State,Lat,Lng,DisplayName,cluster_id\n" + rows
+        )
+        
+        def load():
+            return ProblemState.from_workspace(
+                client="test_client",
+                workspace="test_workspace",
+                entity_type="site",
+                state_code="CA",
+                base_dir=base_dir
+            )
+        
+        service.solve_problem(load(), per_cluster=True, service_time_hours=0.5, speed_mph=50.0)
+        
+        # WHEN: The workspace is reloaded from disk and solved again
+        reloaded = load()
+        messages = []
+        service.solve_problem(
+            reloaded, per_cluster=True, service_time_hours=0.5, speed_mph=50.0,
+            log_callback=messages.append
+        )
+        
+        # THEN: The routes read from solution.csv seed the solver
+        assert all(route.state_code == "CA" for route in load().routes)
+        assert any("Warm-starting" in msg for msg in messages)
+    
+    def test_small_cluster_is_solved_exactly(self):
+        """Test that a single-vehicle cluster gets the shortest tour without OR-Tools."""
+        service = SolveService(time_limit_seconds=30)
+        
+        # GIVEN: Four corners of a square listed in criss-cross order
+        coords = [(37.0, -122.0), (37.1, -121.9), (37.1, -122.0), (37.0, -121.9)]
+        sites = [
+            Site(id=f"Site{i}", address="", state_code="CA", lat=lat, lng=lng)
+            for i, (lat, lng) in enumerate(coords)
+        ]
+        
+        # WHEN: Solve the cluster
+        routes = service._solve_single_route("CA", 1, sites, 0.5, 50.0)
+        
+        # THEN: One exact route walks the perimeter instead of the diagonals
+        assert len(routes) == 1
+        assert routes[0].mode == "exact"
+        assert routes[0].sequence in (
+            ["Site0", "Site2", "Site1", "Site3"],
+            ["Site0", "Site3", "Site1", "Site2"],
+        )
+    
     def test_generate_solution_table_data_basic(self, problem_state_workspace):
         """Test generating solution table data from routes."""
         base_dir, state_dir = problem_state_workspace
@@ -334,7 +334,7 @@ Configuration:
             all_lngs = []
             
             # Collect all coordinates from sites in routes
-            site_dict = {site.id: site for site in self.problem_state.sites}
+            site_dict = self.problem_state.site_by_id
             
             for route in self.problem_state.routes:
                 for site_id in route.sequence: